@@ -6,6 +6,9 @@ All audit entries are append-only. No updates or deletions.
 
 from apps.audit.models import AuditLog
 
+# Rows per INSERT in create_audit_entries()
+AUDIT_BULK_BATCH_SIZE = 1000
+
 
 def create_audit_entry(
     event_type,
@@ -56,3 +59,44 @@ def create_audit_entry(
     )
 
     return audit_entry
+
+
+def create_audit_entries(entries, request_id=None):
+    """
+    Create several audit log entries with a single INSERT.
+
+    Args:
+        entries: Iterable of dicts holding create_audit_entry() arguments
+            (event_type, actor_id, entity_type, entity_id and optionally
+            previous_state / new_state)
+        request_id: Correlation ID for all entries (optional; from context if None)
+
+    Returns:
+        list[AuditLog]: Created audit log entries, in input order
+    """
+    from apps.users.models import User
+    from core.middleware import get_current_request_id
+
+    if request_id is None:
+        request_id = get_current_request_id()
+
+    entries = list(entries)
+    actor_ids = {entry["actor_id"] for entry in entries if entry.get("actor_id")}
+    # Actors may not exist if users were deleted, but we still log
+    actors = {str(pk): user for pk, user in User.objects.in_bulk(actor_ids).items()}
+
+    return AuditLog.objects.bulk_create(
+        [
+            AuditLog(
+                event_type=entry["event_type"],
+                actor=actors.get(str(entry.get("actor_id"))),
+                entity_type=entry["entity_type"],
+                entity_id=entry["entity_id"],
+                previous_state=entry.get("previous_state"),
+                new_state=entry.get("new_state"),
+                request_id=request_id,
+            )
+            for entry in entries
+        ],
+        batch_size=AUDIT_BULK_BATCH_SIZE,
+    )
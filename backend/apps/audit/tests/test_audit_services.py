@@ -0,0 +1,63 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.audit.models import AuditLog
+from apps.audit.services import create_audit_entries
+
+
+class CreateAuditEntriesTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(
+            username="audit_bulk_user",
+            password="password123",
+        )
+
+    def test_entries_are_inserted_together(self):
+        entity_ids = [uuid.uuid4() for _ in range(3)]
+        # actor lookup + one INSERT
+        with self.assertNumQueries(2):
+            created = create_audit_entries(
+                [
+                    {
+                        "event_type": "REQUEST_SUBMITTED",
+                        "actor_id": self.user.id,
+                        "entity_type": "PaymentRequest",
+                        "entity_id": entity_id,
+                        "previous_state": {"status": "DRAFT"},
+                        "new_state": {"status": "SUBMITTED"},
+                    }
+                    for entity_id in entity_ids
+                ],
+                request_id="bulk-request-id",
+            )
+        self.assertEqual([log.entity_id for log in created], entity_ids)
+        logs = AuditLog.objects.filter(entity_id__in=entity_ids)
+        self.assertEqual(logs.count(), 3)
+        for log in logs:
+            self.assertEqual(log.actor, self.user)
+            self.assertEqual(log.request_id, "bulk-request-id")
+            self.assertEqual(log.new_state, {"status": "SUBMITTED"})
+            self.assertIsNotNone(log.occurred_at)
+
+    def test_system_and_missing_actors_are_logged_without_actor(self):
+        created = create_audit_entries(
+            [
+                {
+                    "event_type": "SYSTEM_EVENT",
+                    "actor_id": None,
+                    "entity_type": "PaymentRequest",
+                    "entity_id": uuid.uuid4(),
+                },
+                {
+                    "event_type": "DELETED_ACTOR_EVENT",
+                    "actor_id": uuid.uuid4(),
+                    "entity_type": "PaymentRequest",
+                    "entity_id": uuid.uuid4(),
+                },
+            ]
+        )
+        self.assertEqual([log.actor_id for log in created], [None, None])
+        self.assertEqual(AuditLog.objects.count(), 2)
@@ -0,0 +1,32 @@
+"""
+Custom model fields for the payments domain.
+"""
+
+from django.db import models
+
+
+class PostgresEnumField(models.CharField):
+    """
+    CharField stored as a PostgreSQL ENUM type.
+
+    The type itself is created by a RunSQL migration and must list the same
+    values as the field's choices. Values read back as plain strings, so
+    callers and serializers are unaffected; membership is enforced by the
+    column type instead of a CHECK constraint.
+
+    PostgreSQL sorts ENUM values in declaration order, so ``order_by`` on
+    such a field follows the lifecycle order of the type's labels rather
+    than the alphabet.
+    """
+
+    def __init__(self, *args, enum_name, **kwargs):
+        self.enum_name = enum_name
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["enum_name"] = self.enum_name
+        return name, path, args, kwargs
+
+    def db_type(self, connection):
+        return self.enum_name
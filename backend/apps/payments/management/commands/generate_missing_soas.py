@@ -0,0 +1,55 @@
+"""
+Missing SOA generation management command.
+
+Generates the batch SOA for COMPLETED batches that have none, e.g. when the
+post-commit generation in mark_paid failed. A batch that fails again is
+logged and skipped so the remaining batches are still generated.
+Run periodically (e.g. cron): python manage.py generate_missing_soas
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+from apps.payments.models import PaymentBatch, SOAVersion
+from apps.payments.services import generate_soa_for_batch
+from core.middleware import get_current_request_id
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Generate the SOA for completed batches that are missing one"
+
+    def handle(self, *args, **options):
+        batch_ids = (
+            PaymentBatch.objects.using("default")
+            .filter(status="COMPLETED")
+            .exclude(
+                requests__soa_versions__source=SOAVersion.SOURCE_GENERATED,
+            )
+            .order_by("created_at")
+            .values_list("id", flat=True)
+            .distinct()
+        )
+        generated = 0
+        failed = 0
+        for batch_id in batch_ids:
+            try:
+                if generate_soa_for_batch(batch_id):
+                    generated += 1
+            except Exception:
+                failed += 1
+                logger.exception(
+                    "soa_generation_failed",
+                    extra={
+                        "request_id": get_current_request_id(),
+                        "entity_id": str(batch_id),
+                        "operation": "SOA_GENERATED",
+                        "user_id": None,
+                    },
+                )
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated SOA for {generated} completed batches")
+        )
+        style = self.style.ERROR if failed else self.style.SUCCESS
+        self.stdout.write(style(f"Failed to generate SOA for {failed} batches"))
@@ -0,0 +1,17 @@
+"""
+Payment counts refresh management command.
+
+Recomputes the mv_payment_counts materialized view behind PaymentCounts.
+Run periodically (e.g. cron): python manage.py refresh_payment_counts
+"""
+
+from django.core.management.base import BaseCommand
+from apps.payments.models import PaymentCounts
+
+
+class Command(BaseCommand):
+    help = "Refresh the mv_payment_counts materialized view"
+
+    def handle(self, *args, **options):
+        PaymentCounts.refresh()
+        self.stdout.write(self.style.SUCCESS("Refreshed mv_payment_counts"))
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0008_alter_paymentrequest_execution_id"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="paymentrequest",
+            name="idx_request_batch",
+        ),
+        migrations.RemoveIndex(
+            model_name="paymentrequest",
+            name="idx_request_status_batch",
+        ),
+    ]
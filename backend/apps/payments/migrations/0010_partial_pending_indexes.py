@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0009_remove_redundant_request_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="paymentrequest",
+            name="idx_request_status",
+        ),
+        migrations.RemoveIndex(
+            model_name="paymentbatch",
+            name="idx_batch_status",
+        ),
+        migrations.AddIndex(
+            model_name="paymentbatch",
+            index=models.Index(
+                condition=models.Q(("status__in", ["SUBMITTED", "PROCESSING"])),
+                fields=["created_at"],
+                name="idx_batch_open",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paymentrequest",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING_APPROVAL")),
+                fields=["batch"],
+                name="idx_req_pending",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paymentrequest",
+            index=models.Index(
+                condition=models.Q(("status__in", ["PAID", "REJECTED"]), _negated=True),
+                fields=["created_at"],
+                name="idx_req_open",
+            ),
+        ),
+    ]
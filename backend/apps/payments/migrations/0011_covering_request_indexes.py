@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0010_partial_pending_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="paymentrequest",
+            name="idx_request_batch_status",
+        ),
+        migrations.AddIndex(
+            model_name="paymentrequest",
+            index=models.Index(
+                fields=["batch", "status"],
+                include=(
+                    "amount",
+                    "total_amount",
+                    "currency",
+                    "created_at",
+                    "beneficiary_name",
+                ),
+                name="idx_req_batch_status_cov",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paymentrequest",
+            index=models.Index(
+                fields=["status"],
+                include=("batch", "amount", "currency", "created_at"),
+                name="idx_req_status_cov",
+            ),
+        ),
+    ]
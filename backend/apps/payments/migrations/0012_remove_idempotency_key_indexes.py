@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0011_covering_request_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="idempotencykey",
+            name="idx_idempotency_key",
+        ),
+        migrations.AlterField(
+            model_name="idempotencykey",
+            name="key",
+            field=models.CharField(max_length=255),
+        ),
+    ]
@@ -0,0 +1,27 @@
+import apps.payments.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0012_remove_idempotency_key_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="idempotencykey",
+            name="expires_at",
+            field=models.DateTimeField(
+                default=apps.payments.models.default_idempotency_expiry, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="idempotencykey",
+            index=models.Index(
+                condition=models.Q(("expires_at__isnull", False)),
+                fields=["expires_at"],
+                name="idx_idem_expires",
+            ),
+        ),
+    ]
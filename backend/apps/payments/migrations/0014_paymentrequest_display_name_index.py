@@ -0,0 +1,24 @@
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0013_idempotencykey_expires_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="paymentrequest",
+            index=models.Index(
+                django.db.models.functions.comparison.Coalesce(
+                    "beneficiary_name",
+                    "vendor_snapshot_name",
+                    "subcontractor_snapshot_name",
+                    models.Value("Unknown"),
+                ),
+                name="idx_req_display_name",
+            ),
+        ),
+    ]
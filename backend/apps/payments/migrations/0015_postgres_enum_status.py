@@ -0,0 +1,148 @@
+# Generated by Django 4.2.11 on 2026-10-16 17:02
+
+import apps.payments.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0014_paymentrequest_display_name_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE TYPE payment_batch_status AS ENUM "
+            "('DRAFT', 'SUBMITTED', 'PROCESSING', 'COMPLETED', 'CANCELLED')",
+            reverse_sql="DROP TYPE payment_batch_status",
+        ),
+        migrations.RunSQL(
+            "CREATE TYPE payment_request_status AS ENUM "
+            "('DRAFT', 'SUBMITTED', 'PENDING_APPROVAL', 'APPROVED', 'REJECTED', "
+            "'PAID')",
+            reverse_sql="DROP TYPE payment_request_status",
+        ),
+        migrations.RunSQL(
+            "CREATE TYPE approval_decision AS ENUM ('APPROVED', 'REJECTED')",
+            reverse_sql="DROP TYPE approval_decision",
+        ),
+        migrations.RemoveConstraint(
+            model_name="approvalrecord",
+            name="valid_decision",
+        ),
+        migrations.RemoveConstraint(
+            model_name="paymentbatch",
+            name="valid_batch_status",
+        ),
+        migrations.RemoveConstraint(
+            model_name="paymentrequest",
+            name="valid_request_status",
+        ),
+        migrations.SeparateDatabaseAndState(
+            # Partial indexes on status are rebuilt around the type change so
+            # their predicates compare against the ENUM, not a text cast.
+            database_operations=[
+                migrations.RemoveIndex(
+                    model_name="paymentbatch",
+                    name="idx_batch_open",
+                ),
+                migrations.RemoveIndex(
+                    model_name="paymentrequest",
+                    name="idx_req_pending",
+                ),
+                migrations.RemoveIndex(
+                    model_name="paymentrequest",
+                    name="idx_req_open",
+                ),
+                migrations.RunSQL(
+                    "ALTER TABLE approval_records ALTER COLUMN decision "
+                    "TYPE approval_decision USING decision::approval_decision",
+                    reverse_sql="ALTER TABLE approval_records ALTER COLUMN decision "
+                    "TYPE varchar(20) USING decision::text",
+                ),
+                migrations.RunSQL(
+                    "ALTER TABLE payment_batches ALTER COLUMN status "
+                    "TYPE payment_batch_status USING status::payment_batch_status",
+                    reverse_sql="ALTER TABLE payment_batches ALTER COLUMN status "
+                    "TYPE varchar(20) USING status::text",
+                ),
+                migrations.RunSQL(
+                    "ALTER TABLE payment_requests ALTER COLUMN status "
+                    "TYPE payment_request_status "
+                    "USING status::payment_request_status",
+                    reverse_sql="ALTER TABLE payment_requests ALTER COLUMN status "
+                    "TYPE varchar(20) USING status::text",
+                ),
+                migrations.AddIndex(
+                    model_name="paymentbatch",
+                    index=models.Index(
+                        condition=models.Q(("status__in", ["SUBMITTED", "PROCESSING"])),
+                        fields=["created_at"],
+                        name="idx_batch_open",
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="paymentrequest",
+                    index=models.Index(
+                        condition=models.Q(("status", "PENDING_APPROVAL")),
+                        fields=["batch"],
+                        name="idx_req_pending",
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="paymentrequest",
+                    index=models.Index(
+                        condition=models.Q(
+                            ("status__in", ["PAID", "REJECTED"]), _negated=True
+                        ),
+                        fields=["created_at"],
+                        name="idx_req_open",
+                    ),
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="approvalrecord",
+                    name="decision",
+                    field=apps.payments.fields.PostgresEnumField(
+                        choices=[("APPROVED", "Approved"), ("REJECTED", "Rejected")],
+                        enum_name="approval_decision",
+                        max_length=20,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="paymentbatch",
+                    name="status",
+                    field=apps.payments.fields.PostgresEnumField(
+                        choices=[
+                            ("DRAFT", "Draft"),
+                            ("SUBMITTED", "Submitted"),
+                            ("PROCESSING", "Processing"),
+                            ("COMPLETED", "Completed"),
+                            ("CANCELLED", "Cancelled"),
+                        ],
+                        default="DRAFT",
+                        enum_name="payment_batch_status",
+                        max_length=20,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="paymentrequest",
+                    name="status",
+                    field=apps.payments.fields.PostgresEnumField(
+                        choices=[
+                            ("DRAFT", "Draft"),
+                            ("SUBMITTED", "Submitted"),
+                            ("PENDING_APPROVAL", "Pending Approval"),
+                            ("APPROVED", "Approved"),
+                            ("REJECTED", "Rejected"),
+                            ("PAID", "Paid"),
+                        ],
+                        default="DRAFT",
+                        enum_name="payment_request_status",
+                        max_length=20,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.11 on 2026-10-16 17:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0015_postgres_enum_status"),
+    ]
+
+    # mv_payment_counts reads payment_requests.status, so PostgreSQL will
+    # refuse to change that column's type while the view exists: a later
+    # ALTER COLUMN status TYPE must drop the view first and recreate it
+    # (and its unique index) afterwards.
+    operations = [
+        migrations.RunSQL(
+            """
+            CREATE MATERIALIZED VIEW mv_payment_counts AS
+            SELECT batch_id::text || ':' || status::text AS id,
+                   status::text AS status,
+                   batch_id,
+                   count(*)::integer AS n
+            FROM payment_requests
+            GROUP BY status, batch_id;
+            CREATE UNIQUE INDEX idx_mv_payment_counts
+                ON mv_payment_counts (status, batch_id);
+            """,
+            reverse_sql="DROP MATERIALIZED VIEW mv_payment_counts",
+        ),
+        migrations.CreateModel(
+            name="PaymentCounts",
+            fields=[
+                (
+                    "id",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("status", models.CharField(max_length=20)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="payments.paymentbatch",
+                    ),
+                ),
+                ("n", models.IntegerField()),
+            ],
+            options={
+                "db_table": "mv_payment_counts",
+                "managed": False,
+            },
+        ),
+    ]
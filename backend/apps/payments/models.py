@@ -5,24 +5,64 @@ All models follow the domain model specification (02_DOMAIN_MODEL.md).
 """
 
 import uuid
-from django.db import models
+from datetime import timedelta
+from functools import cached_property
+
+from django.db import connection, models, transaction
+from django.db.models.functions import Cast, Coalesce
 from django.core.validators import MinValueValidator
+from django.utils import timezone
+
+from apps.payments.fields import PostgresEnumField
+
+# Rows per INSERT/UPDATE statement for bulk request writes
+BULK_BATCH_SIZE = 1000
+
+# Retention window for idempotency keys; expired keys are purged by the
+# purge_idempotency_keys management command.
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+
+def default_idempotency_expiry():
+    """Expiry timestamp for a newly reserved idempotency key."""
+    return timezone.now() + IDEMPOTENCY_KEY_TTL
+
+
+class BatchStatus(models.TextChoices):
+    DRAFT = "DRAFT", "Draft"
+    SUBMITTED = "SUBMITTED", "Submitted"
+    PROCESSING = "PROCESSING", "Processing"
+    COMPLETED = "COMPLETED", "Completed"
+    CANCELLED = "CANCELLED", "Cancelled"
+
+
+class RequestStatus(models.TextChoices):
+    DRAFT = "DRAFT", "Draft"
+    SUBMITTED = "SUBMITTED", "Submitted"
+    PENDING_APPROVAL = "PENDING_APPROVAL", "Pending Approval"
+    APPROVED = "APPROVED", "Approved"
+    REJECTED = "REJECTED", "Rejected"
+    PAID = "PAID", "Paid"
+
+
+class ApprovalDecision(models.TextChoices):
+    APPROVED = "APPROVED", "Approved"
+    REJECTED = "REJECTED", "Rejected"
 
 
 class PaymentBatch(models.Model):
     """PaymentBatch model - logical grouping of payment requests."""
 
-    STATUS_CHOICES = [
-        ("DRAFT", "Draft"),
-        ("SUBMITTED", "Submitted"),
-        ("PROCESSING", "Processing"),
-        ("COMPLETED", "Completed"),
-        ("CANCELLED", "Cancelled"),
-    ]
+    Status = BatchStatus
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="DRAFT")
+    status = PostgresEnumField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.DRAFT,
+        enum_name="payment_batch_status",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(
         "users.User", on_delete=models.PROTECT, related_name="created_batches"
@@ -32,19 +72,8 @@ class PaymentBatch(models.Model):
 
     class Meta:
         db_table = "payment_batches"
+        # Status membership is enforced by the payment_batch_status ENUM type
         constraints = [
-            models.CheckConstraint(
-                check=models.Q(
-                    status__in=[
-                        "DRAFT",
-                        "SUBMITTED",
-                        "PROCESSING",
-                        "COMPLETED",
-                        "CANCELLED",
-                    ]
-                ),
-                name="valid_batch_status",
-            ),
             # submitted_at NOT NULL when status != 'DRAFT'
             models.CheckConstraint(
                 check=models.Q(status="DRAFT") | models.Q(submitted_at__isnull=False),
@@ -58,7 +87,12 @@ class PaymentBatch(models.Model):
             ),
         ]
         indexes = [
-            models.Index(fields=["status"], name="idx_batch_status"),
+            # Partial index: only in-flight batches, not the full history
+            models.Index(
+                fields=["created_at"],
+                name="idx_batch_open",
+                condition=models.Q(status__in=["SUBMITTED", "PROCESSING"]),
+            ),
             models.Index(fields=["created_by"], name="idx_batch_created_by"),
         ]
 
@@ -66,17 +100,129 @@ class PaymentBatch(models.Model):
         return f"{self.title} ({self.status})"
 
 
+def display_name_expression():
+    """SQL fallback chain for a request's display name (legacy or ledger)."""
+    return Coalesce(
+        "beneficiary_name",
+        "vendor_snapshot_name",
+        "subcontractor_snapshot_name",
+        models.Value("Unknown"),
+    )
+
+
+def display_amount_expression():
+    """SQL fallback chain for a request's display amount (legacy or ledger)."""
+    return Coalesce(
+        "amount",
+        "total_amount",
+        models.Value(0),
+        output_field=models.DecimalField(max_digits=15, decimal_places=2),
+    )
+
+
+def display_total_expression():
+    """
+    SQL for the list totalAmount: total_amount (ledger) else amount (legacy).
+
+    Rendered as text by Postgres (numeric(15,2) keeps two decimals), so list
+    serialization passes the string through instead of formatting Decimals.
+    """
+    return Cast(Coalesce("total_amount", "amount"), models.CharField())
+
+
+def display_entity_name_expression():
+    """SQL for the list entityName: the snapshot name matching entity_type."""
+    return models.Case(
+        models.When(
+            entity_type="VENDOR",
+            vendor_snapshot_name__gt="",
+            then="vendor_snapshot_name",
+        ),
+        models.When(
+            entity_type="SUBCONTRACTOR",
+            subcontractor_snapshot_name__gt="",
+            then="subcontractor_snapshot_name",
+        ),
+        default=models.Value(None),
+        output_field=models.CharField(),
+    )
+
+
+# Columns read by PaymentRequestListSerializer (see dicts_for_list())
+LIST_FIELDS = (
+    "id",
+    "batch_id",
+    "status",
+    "currency",
+    "beneficiary_name",
+    "purpose",
+    "created_at",
+)
+
+
+class PaymentRequestQuerySet(models.QuerySet):
+    """QuerySet helpers for PaymentRequest read paths."""
+
+    def with_display(self):
+        """Annotate display_name/display_amount computed by the database."""
+        return self.annotate(
+            display_name=display_name_expression(),
+            display_amount=display_amount_expression(),
+        )
+
+    def with_list_display(self):
+        """
+        Annotate the values PaymentRequestListSerializer reads beyond columns.
+
+        amount_text, display_total, display_entity_name and batch_title are
+        computed in SQL, so the serializer works on these instances or on
+        dicts_for_list() rows alike.
+        """
+        return self.annotate(
+            amount_text=Cast("amount", models.CharField()),
+            display_total=display_total_expression(),
+            display_entity_name=display_entity_name_expression(),
+            batch_title=models.F("batch__title"),
+        )
+
+    def dicts_for_list(self, *extra_fields):
+        """
+        Return list rows as plain dicts instead of model instances.
+
+        Skips per-row model construction on large list pages. Rows carry
+        only LIST_FIELDS (plus `extra_fields`) and the with_list_display()
+        annotations, so model properties such as display_str are
+        unavailable; compute display values in the query instead.
+        """
+        return self.with_list_display().values(
+            *LIST_FIELDS,
+            *extra_fields,
+            "amount_text",
+            "display_total",
+            "display_entity_name",
+            "batch_title",
+        )
+
+    def claim(self, limit=100):
+        """
+        Lock up to `limit` unclaimed pending requests for an approval worker.
+
+        Rows locked by another worker are skipped rather than waited on, and
+        only payment_requests rows are locked (not joined FK tables), so
+        concurrent workers claim disjoint sets. Must run inside
+        transaction.atomic().
+        """
+        return (
+            self.filter(status="PENDING_APPROVAL", execution_id__isnull=True)
+            .select_for_update(of=("self",), skip_locked=True)
+            .order_by("created_at")[:limit]
+        )
+
+
 class PaymentRequest(models.Model):
     """PaymentRequest model - single payment instruction within a batch."""
 
-    STATUS_CHOICES = [
-        ("DRAFT", "Draft"),
-        ("SUBMITTED", "Submitted"),
-        ("PENDING_APPROVAL", "Pending Approval"),
-        ("APPROVED", "Approved"),
-        ("REJECTED", "Rejected"),
-        ("PAID", "Paid"),
-    ]
+    Status = RequestStatus
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     batch = models.ForeignKey(
@@ -93,7 +239,12 @@ class PaymentRequest(models.Model):
     beneficiary_name = models.CharField(max_length=255, null=True, blank=True)
     beneficiary_account = models.CharField(max_length=255, null=True, blank=True)
     purpose = models.TextField(null=True, blank=True)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="DRAFT")
+    status = PostgresEnumField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.DRAFT,
+        enum_name="payment_request_status",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(
         "users.User", on_delete=models.PROTECT, related_name="created_requests"
@@ -167,22 +318,12 @@ class PaymentRequest(models.Model):
     version = models.IntegerField(default=1)
     execution_id = models.UUIDField(null=True, blank=True)
 
+    objects = PaymentRequestQuerySet.as_manager()
+
     class Meta:
         db_table = "payment_requests"
+        # Status membership is enforced by the payment_request_status ENUM type
         constraints = [
-            models.CheckConstraint(
-                check=models.Q(
-                    status__in=[
-                        "DRAFT",
-                        "SUBMITTED",
-                        "PENDING_APPROVAL",
-                        "APPROVED",
-                        "REJECTED",
-                        "PAID",
-                    ]
-                ),
-                name="valid_request_status",
-            ),
             models.CheckConstraint(
                 check=models.Q(amount__isnull=True) | models.Q(amount__gt=0),
                 name="amount_positive",
@@ -229,31 +370,150 @@ class PaymentRequest(models.Model):
             ),
         ]
         indexes = [
-            models.Index(fields=["batch"], name="idx_request_batch"),
-            models.Index(fields=["status"], name="idx_request_status"),
-            models.Index(fields=["batch", "status"], name="idx_request_batch_status"),
-            models.Index(fields=["status", "batch"], name="idx_request_status_batch"),
+            # Covering indexes: list columns are INCLUDEd so batch/status lists
+            # are index-only scans. (batch, status) also serves batch-only
+            # lookups via its leading column.
+            models.Index(
+                fields=["batch", "status"],
+                include=[
+                    "amount",
+                    "total_amount",
+                    "currency",
+                    "created_at",
+                    "beneficiary_name",
+                ],
+                name="idx_req_batch_status_cov",
+            ),
+            models.Index(
+                fields=["status"],
+                include=["batch", "amount", "currency", "created_at"],
+                name="idx_req_status_cov",
+            ),
+            # Partial indexes: sized by open work, not by total history
+            models.Index(
+                fields=["batch"],
+                name="idx_req_pending",
+                condition=models.Q(status="PENDING_APPROVAL"),
+            ),
+            models.Index(
+                fields=["created_at"],
+                name="idx_req_open",
+                condition=~models.Q(status__in=["PAID", "REJECTED"]),
+            ),
             models.Index(fields=["execution_id"], name="idx_request_execution_id"),
+            models.Index(display_name_expression(), name="idx_req_display_name"),
         ]
 
-    def __str__(self):
-        name = (
+    @classmethod
+    def bulk_create_for_batch(cls, batch, rows):
+        """
+        Insert many requests into a batch with multi-row INSERTs.
+
+        Args:
+            batch: PaymentBatch the requests belong to
+            rows: Iterable of field dicts (without batch)
+
+        Returns:
+            list[PaymentRequest]: Created requests
+
+        Validation and audit entries remain the caller's (service layer's) job.
+        """
+        with transaction.atomic():
+            return cls.objects.bulk_create(
+                [cls(batch=batch, **row) for row in rows],
+                batch_size=BULK_BATCH_SIZE,
+            )
+
+    @classmethod
+    def bulk_update_status(cls, requests, status, updated_by=None):
+        """
+        Set status on already-locked requests with a single UPDATE.
+
+        Every row gets the same values, so a plain UPDATE ... WHERE id IN (...)
+        replaces bulk_update()'s per-row CASE expressions. QuerySet.update()
+        skips auto_now, so updated_at is stamped here; the in-memory
+        instances are kept in sync.
+        """
+        now = timezone.now()
+        values = {"status": status, "updated_at": now}
+        if updated_by is not None:
+            values["updated_by"] = updated_by
+        for req in requests:
+            for name, value in values.items():
+                setattr(req, name, value)
+        cls.objects.filter(pk__in=[req.pk for req in requests]).update(**values)
+
+    @cached_property
+    def display_str(self):
+        """
+        Human-readable form, formatted once per instance.
+
+        Admin, DRF and logging call str() repeatedly; the Decimal formatting
+        is memoized, so the text reflects the instance at first access.
+        """
+        # Prefer values annotated by with_display(); fall back for plain rows
+        name = getattr(self, "display_name", None) or (
             self.beneficiary_name
             or self.vendor_snapshot_name
             or self.subcontractor_snapshot_name
             or "Unknown"
         )
-        amt = self.amount or self.total_amount or 0
+        amt = getattr(self, "display_amount", None)
+        if amt is None:
+            amt = self.amount or self.total_amount or 0
         return f"{name} - {amt} {self.currency} ({self.status})"
 
+    def __str__(self):
+        return self.display_str
+
+
+class PaymentCounts(models.Model):
+    """
+    Request counts per (status, batch) from the mv_payment_counts
+    materialized view.
+
+    Read-only and eventually consistent: values lag live data until the
+    refresh_payment_counts command runs. Use for dashboards, not for
+    business rules.
+
+    The view depends on the payment_requests.status column type: changing
+    that type requires dropping and recreating the view (see migration
+    0016).
+    """
+
+    id = models.CharField(max_length=64, primary_key=True)  # "<batch_id>:<status>"
+    status = models.CharField(max_length=20)
+    batch = models.ForeignKey(
+        PaymentBatch,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    n = models.IntegerField()
+
+    class Meta:
+        managed = False
+        db_table = "mv_payment_counts"
+
+    @classmethod
+    def refresh(cls):
+        """Recompute the view without blocking concurrent readers."""
+        with connection.cursor() as cursor:
+            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_payment_counts")
+
+    @classmethod
+    def total_for_status(cls, status):
+        """Count of requests in `status` across all batches."""
+        return (
+            cls.objects.filter(status=status).aggregate(total=models.Sum("n"))["total"]
+            or 0
+        )
+
 
 class ApprovalRecord(models.Model):
     """ApprovalRecord model - record of approval or rejection action."""
 
-    DECISION_CHOICES = [
-        ("APPROVED", "Approved"),
-        ("REJECTED", "Rejected"),
-    ]
+    Decision = ApprovalDecision
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     payment_request = models.OneToOneField(
@@ -262,18 +522,15 @@ class ApprovalRecord(models.Model):
     approver = models.ForeignKey(
         "users.User", on_delete=models.PROTECT, related_name="approval_records"
     )
-    decision = models.CharField(max_length=20, choices=DECISION_CHOICES)
+    decision = PostgresEnumField(
+        max_length=20, choices=Decision.choices, enum_name="approval_decision"
+    )
     comment = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "approval_records"
-        constraints = [
-            models.CheckConstraint(
-                check=models.Q(decision__in=["APPROVED", "REJECTED"]),
-                name="valid_decision",
-            ),
-        ]
+        # Decision membership is enforced by the approval_decision ENUM type
         indexes = [
             models.Index(fields=["payment_request"], name="idx_approval_request"),
         ]
@@ -335,11 +592,12 @@ class IdempotencyKey(models.Model):
     """Idempotency key for preventing duplicate financial operations."""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    key = models.CharField(max_length=255, db_index=True)
+    key = models.CharField(max_length=255)
     operation = models.CharField(max_length=100)
     target_object_id = models.UUIDField(null=True)
     response_code = models.IntegerField(null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(null=True, default=default_idempotency_expiry)
 
     class Meta:
         db_table = "idempotency_keys"
@@ -348,8 +606,14 @@ class IdempotencyKey(models.Model):
                 fields=["key", "operation"], name="unique_idempotency_per_operation"
             )
         ]
+        # No standalone index on key: the unique constraint's leading column
+        # already serves lookups by key.
         indexes = [
-            models.Index(fields=["key"], name="idx_idempotency_key"),
+            models.Index(
+                fields=["expires_at"],
+                name="idx_idem_expires",
+                condition=models.Q(expires_at__isnull=False),
+            ),
         ]
 
     def __str__(self):
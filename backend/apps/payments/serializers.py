@@ -5,15 +5,71 @@ No business logic in serializers - validation only.
 All mutations flow through service layer.
 """
 
+import copy
+from collections.abc import Mapping
+from decimal import Decimal
+from operator import attrgetter
+
+from django.db.models import (
+    CharField,
+    Count,
+    Func,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 from apps.payments.models import (
+    LIST_FIELDS,
     PaymentBatch,
     PaymentRequest,
     SOAVersion,
 )
 
+# Attribute getters for the live SOA summary loop
+_summary_fields = attrgetter("id", "beneficiary_name", "amount", "currency")
+_version_number = attrgetter("version_number")
+
+
+def uploaded_on_expression():
+    """SOA upload time as "YYYY-MM-DD HH:MM" text, formatted by Postgres."""
+    return Func(
+        "uploaded_at",
+        Value("YYYY-MM-DD HH24:MI"),
+        function="to_char",
+        output_field=CharField(),
+    )
+
+
+def soa_download_url(batch_id, request_id, soa_id):
+    """API path for downloading one SOA version's document."""
+    return f"/api/v1/batches/{batch_id}/requests/{request_id}/soa/{soa_id}/download"
+
 
-class PaymentRequestSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class instead of per instance.
+
+    get_fields() introspects the model every time a serializer is created,
+    but its result depends only on the class. Each instance gets deep
+    copies, which DRF rebuilds from the field's constructor arguments: a
+    field binds to its parent and may have its validators or error messages
+    changed per instance, so nothing may be shared with the cached prototype.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get("_cached_fields")
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return copy.deepcopy(cached)
+
+
+class PaymentRequestSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for PaymentRequest with Phase 2 fields."""
 
     id = serializers.UUIDField(read_only=True)
@@ -143,114 +199,166 @@ class PaymentRequestSerializer(serializers.ModelSerializer):
         return None
 
 
+class ApprovalSerializer(serializers.Serializer):
+    """Read-only approval decision embedded in request detail."""
+
+    decision = serializers.CharField(read_only=True)
+    comment = serializers.CharField(read_only=True)
+    approverId = serializers.UUIDField(source="approver_id", read_only=True)
+    createdAt = serializers.DateTimeField(source="created_at", read_only=True)
+
+
 class PaymentRequestDetailSerializer(PaymentRequestSerializer):
     """Serializer for PaymentRequest detail with approval and SOA versions."""
 
-    approval = serializers.SerializerMethodField()
+    approval = ApprovalSerializer(read_only=True)
     soaVersions = serializers.SerializerMethodField()
 
     class Meta(PaymentRequestSerializer.Meta):
         fields = PaymentRequestSerializer.Meta.fields + ["approval", "soaVersions"]
 
-    def get_approval(self, obj):
-        """Get approval record if exists."""
-        if hasattr(obj, "approval"):
-            approval = obj.approval
-            return {
-                "decision": approval.decision,
-                "comment": approval.comment,
-                "approverId": str(approval.approver_id),
-                "createdAt": approval.created_at.isoformat(),
-            }
-        return None
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load approval and ordered SOA versions (with uploaders) up front."""
+        return queryset.select_related("approval").prefetch_related(
+            Prefetch(
+                "soa_versions",
+                queryset=SOAVersion.objects.select_related("uploaded_by")
+                .annotate(uploaded_on=uploaded_on_expression())
+                .order_by("version_number"),
+            )
+        )
 
     def get_soaVersions(self, obj):
         """Get SOA versions with change summary (version header)."""
-        soas = obj.soa_versions.select_related("uploaded_by").order_by("version_number")
+        soas = obj.soa_versions.all()
+        if "soa_versions" not in getattr(obj, "_prefetched_objects_cache", {}):
+            # Not loaded via setup_eager_loading()
+            soas = (
+                soas.select_related("uploaded_by")
+                .annotate(uploaded_on=uploaded_on_expression())
+                .order_by("version_number")
+            )
+        soas = list(soas)
+        # One label per distinct uploader rather than per version
+        uploaders = {soa.uploaded_by for soa in soas if soa.uploaded_by_id}
+        labels = {user.id: user.display_name or user.username for user in uploaders}
         result = []
         for soa in soas:
-            uploader = (
-                (soa.uploaded_by.display_name or soa.uploaded_by.username)
-                if soa.uploaded_by
-                else "System"
-            )
+            uploader = labels.get(soa.uploaded_by_id, "System")
+            uploaded_on = soa.uploaded_on
             if soa.version_number == 1:
-                change_summary = (
-                    f"Initial upload by {uploader} "
-                    f"on {soa.uploaded_at.strftime('%Y-%m-%d %H:%M')}"
-                )
+                change_summary = f"Initial upload by {uploader} on {uploaded_on}"
             else:
                 prev_v = soa.version_number - 1
                 change_summary = (
                     f"Version {soa.version_number} - Replaces v{prev_v}, "
-                    f"uploaded by {uploader} "
-                    f"on {soa.uploaded_at.strftime('%Y-%m-%d %H:%M')}"
+                    f"uploaded by {uploader} on {uploaded_on}"
                 )
             result.append(
                 {
-                    "id": str(soa.id),
+                    "id": soa.id,
                     "versionNumber": soa.version_number,
-                    "uploadedAt": soa.uploaded_at.isoformat(),
-                    "uploadedBy": (
-                        str(soa.uploaded_by_id) if soa.uploaded_by_id else None
-                    ),
+                    "uploadedAt": soa.uploaded_at,
+                    "uploadedBy": soa.uploaded_by_id,
                     "uploadedByName": uploader,
                     "source": soa.source,
                     "changeSummary": change_summary,
-                    "downloadUrl": (
-                        f"/api/v1/batches/{obj.batch_id}/requests/{obj.id}/"
-                        f"soa/{soa.id}/download"
-                    ),
+                    "downloadUrl": soa_download_url(obj.batch_id, obj.id, soa.id),
                 }
             )
         return result
 
 
-class PaymentRequestListSerializer(serializers.ModelSerializer):
-    """Serializer for payment request list (approval queue)."""
+class PaymentRequestListSerializer(serializers.Serializer):
+    """
+    Serializer for payment request list (approval queue).
+
+    Reads the plain dict rows from PaymentRequest.objects.dicts_for_list(),
+    or instances annotated by with_list_display(). Plain instances are
+    turned into the same row from their model columns.
+    """
 
     id = serializers.UUIDField(read_only=True)
     batchId = serializers.UUIDField(source="batch_id", read_only=True)
-    batchTitle = serializers.CharField(source="batch.title", read_only=True)
+    batchTitle = serializers.CharField(source="batch_title", read_only=True)
+    # Amounts arrive as text from SQL (see with_list_display())
+    amount = serializers.CharField(source="amount_text", read_only=True)
+    totalAmount = serializers.CharField(source="display_total", read_only=True)
+    currency = serializers.CharField(read_only=True)
     beneficiaryName = serializers.CharField(source="beneficiary_name", read_only=True)
-    entityName = serializers.SerializerMethodField()
-    totalAmount = serializers.SerializerMethodField()
+    entityName = serializers.CharField(source="display_entity_name", read_only=True)
+    purpose = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
     createdAt = serializers.DateTimeField(source="created_at", read_only=True)
 
-    class Meta:
-        model = PaymentRequest
-        fields = [
-            "id",
-            "batchId",
-            "batchTitle",
-            "amount",
-            "totalAmount",
-            "currency",
-            "beneficiaryName",
-            "entityName",
-            "purpose",
-            "status",
-            "createdAt",
-        ]
-
-    def get_entityName(self, obj):
-        """Get entity name (display-safe)."""
-        if obj.entity_type == "VENDOR" and obj.vendor_snapshot_name:
-            return obj.vendor_snapshot_name
-        elif obj.entity_type == "SUBCONTRACTOR" and obj.subcontractor_snapshot_name:
-            return obj.subcontractor_snapshot_name
-        return None
-
-    def get_totalAmount(self, obj):
-        """Get total amount (ledger-driven) or amount (legacy)."""
-        if obj.total_amount is not None:
-            return str(obj.total_amount)
-        elif obj.amount is not None:
-            return str(obj.amount)
-        return None
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Narrow rows to the listed columns; batch title comes from a JOIN."""
+        return queryset.dicts_for_list()
+
+    def to_representation(self, instance):
+        """
+        Build dicts_for_list() rows directly instead of per-field dispatch.
+
+        Row values are already strings or None apart from the UUIDs and
+        created_at, so only those need converting. Annotated instances
+        (batch detail) take the generic path; both must produce the same
+        output.
+        """
+        if not isinstance(instance, Mapping):
+            if hasattr(instance, "batch_title"):
+                return super().to_representation(instance)
+            instance = self._list_row(instance)
+        created_at = instance["created_at"]
+        return {
+            "id": str(instance["id"]),
+            "batchId": str(instance["batch_id"]),
+            "batchTitle": instance["batch_title"],
+            "amount": instance["amount_text"],
+            "totalAmount": instance["display_total"],
+            "currency": instance["currency"],
+            "beneficiaryName": instance["beneficiary_name"],
+            "entityName": instance["display_entity_name"],
+            "purpose": instance["purpose"],
+            "status": instance["status"],
+            "createdAt": (
+                self.fields["createdAt"].to_representation(created_at)
+                if created_at is not None
+                else None
+            ),
+        }
+
+    @staticmethod
+    def _list_row(instance):
+        """
+        dicts_for_list() row for an instance not annotated by
+        with_list_display(), mirroring its SQL expressions in Python.
+
+        Reads batch.title, so select_related("batch") to avoid a query.
+        """
+        row = {name: getattr(instance, name) for name in LIST_FIELDS}
+        total = instance.total_amount
+        if total is None:
+            total = instance.amount
+        entity_name = None
+        if instance.entity_type == "VENDOR" and instance.vendor_snapshot_name:
+            entity_name = instance.vendor_snapshot_name
+        elif (
+            instance.entity_type == "SUBCONTRACTOR"
+            and instance.subcontractor_snapshot_name
+        ):
+            entity_name = instance.subcontractor_snapshot_name
+        row.update(
+            amount_text=None if instance.amount is None else str(instance.amount),
+            display_total=None if total is None else str(total),
+            display_entity_name=entity_name,
+            batch_title=instance.batch.title,
+        )
+        return row
 
 
-class PaymentBatchSerializer(serializers.ModelSerializer):
+class PaymentBatchSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for PaymentBatch."""
 
     id = serializers.UUIDField(read_only=True)
@@ -287,14 +395,22 @@ class PaymentBatchSerializer(serializers.ModelSerializer):
         ]
 
     def get_requestCount(self, obj):
-        """Get count of requests in batch."""
+        """
+        Get count of requests in batch.
+
+        List views annotate request_count=Count("requests") so this does not
+        issue a COUNT query per batch; other callers fall back to one.
+        """
+        if hasattr(obj, "request_count"):
+            return obj.request_count
         return obj.requests.count()
 
 
 class PaymentBatchDetailSerializer(PaymentBatchSerializer):
     """Serializer for batch detail with requests, totals, Live SOA."""
 
-    requests = PaymentRequestSerializer(many=True, read_only=True)
+    # Expects requests prefetched by setup_eager_loading()
+    requests = PaymentRequestListSerializer(many=True, read_only=True)
     batchTotal = serializers.SerializerMethodField()
     liveSoaSummary = serializers.SerializerMethodField()
 
@@ -305,37 +421,56 @@ class PaymentBatchDetailSerializer(PaymentBatchSerializer):
             "liveSoaSummary",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Annotate count/total and prefetch list-ready requests with SOAs."""
+        batch_total = (
+            PaymentRequest.objects.filter(batch=OuterRef("pk"))
+            .values("batch")
+            .annotate(total=Sum(Coalesce("total_amount", "amount")))
+            .values("total")
+        )
+        return queryset.annotate(
+            request_count=Count("requests"),
+            batch_total=Coalesce(Subquery(batch_total), Value(Decimal("0"))),
+        ).prefetch_related(
+            Prefetch("requests", queryset=PaymentRequest.objects.with_list_display()),
+            "requests__soa_versions",
+        )
+
     def get_batchTotal(self, obj):
         """Compute sum of request amounts (totals validation)."""
-        from decimal import Decimal
-
-        # Sum total_amount where present (ledger-driven), else amount (legacy)
-        total = Decimal("0")
-        for req in obj.requests.all():
-            if req.total_amount is not None:
-                total += req.total_amount
-            elif req.amount is not None:
-                total += req.amount
-        return str(total)
+        # Sum total_amount where present (ledger-driven), else amount (legacy).
+        # setup_eager_loading() annotates batch_total; fall back to one
+        # aggregate query for a plain instance.
+        if hasattr(obj, "batch_total"):
+            total = obj.batch_total
+        else:
+            total = obj.requests.aggregate(
+                total=Sum(Coalesce("total_amount", "amount"))
+            )["total"]
+        return str(total if total is not None else Decimal("0"))
 
     def get_liveSoaSummary(self, obj):
         """Live SOA view: computed latest SOA status per request."""
         summary = []
-        requests = obj.requests.prefetch_related("soa_versions").all()
+        requests = obj.requests.all()
+        if "requests" not in getattr(obj, "_prefetched_objects_cache", {}):
+            requests = requests.prefetch_related("soa_versions")
         for req in requests:
-            soas = list(req.soa_versions.all().order_by("-version_number"))
-            latest = soas[0] if soas else None
+            request_id, beneficiary_name, amount, currency = _summary_fields(req)
+            # Pick the latest in Python; order_by() would bypass the prefetch
+            soas = list(req.soa_versions.all())
+            latest = max(soas, key=_version_number, default=None)
             summary.append(
                 {
-                    "requestId": str(req.id),
-                    "beneficiaryName": req.beneficiary_name,
-                    "amount": str(req.amount),
-                    "currency": req.currency,
+                    "requestId": request_id,
+                    "beneficiaryName": beneficiary_name,
+                    "amount": str(amount),
+                    "currency": currency,
                     "hasSoa": len(soas) > 0,
                     "latestVersion": latest.version_number if latest else None,
-                    "latestUploadedAt": (
-                        latest.uploaded_at.isoformat() if latest else None
-                    ),
+                    "latestUploadedAt": latest.uploaded_at if latest else None,
                 }
             )
         return summary
@@ -347,7 +482,7 @@ class ApprovalRequestSerializer(serializers.Serializer):
     comment = serializers.CharField(required=False, allow_blank=True)
 
 
-class SOAVersionSerializer(serializers.ModelSerializer):
+class SOAVersionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for SOAVersion."""
 
     id = serializers.UUIDField(read_only=True)
@@ -385,7 +520,6 @@ class SOAVersionDetailSerializer(SOAVersionSerializer):
     def get_downloadUrl(self, obj):
         """Generate download URL for SOA document."""
         # In production, generate signed URL or use proper storage backend
-        return (
-            f"/api/v1/batches/{obj.payment_request.batch_id}/requests/"
-            f"{obj.payment_request_id}/soa/{obj.id}/download"
+        return soa_download_url(
+            obj.payment_request.batch_id, obj.payment_request_id, obj.id
         )
@@ -9,9 +9,14 @@ Rules:
 - No direct model.save() from views
 """
 
+import io
 import logging
+import uuid
 
+from django.core.files.base import File
+from django.core.files.storage import default_storage
 from django.db import transaction, IntegrityError
+from django.db.models import Max, Subquery
 from django.utils import timezone
 from core.exceptions import (
     ValidationError,
@@ -21,7 +26,10 @@ from core.exceptions import (
     PreconditionFailedError,
 )
 from core.middleware import get_current_request_id
+from apps.ledger.models import Vendor, Subcontractor, Site
 from apps.payments.models import (
+    BULK_BATCH_SIZE,
+    IdempotencyKey,
     PaymentBatch,
     PaymentRequest,
     ApprovalRecord,
@@ -31,12 +39,68 @@ from apps.payments.state_machine import (
     validate_transition,
     is_closed_batch,
 )
-from apps.payments.versioning import version_locked_update
-from apps.audit.services import create_audit_entry
+from apps.payments.versioning import atomic_transition, version_locked_update
+from apps.audit.services import create_audit_entry, create_audit_entries
+from apps.users.models import User, Role
 
 logger = logging.getLogger(__name__)
 
 
+def _matches_id(pk, value):
+    """Compare a UUID key with an id passed either as a UUID or as a string."""
+    if isinstance(value, uuid.UUID):
+        return pk == value
+    return str(pk) == str(value)
+
+
+def _replayed_request(idempotency_key, operation):
+    """
+    Return the request already recorded for an idempotency key, or None.
+
+    The key's target is resolved in a subquery, so a replay costs one query.
+    None means the key is still reserved by an in-flight (or failed) call.
+    """
+    target = IdempotencyKey.objects.filter(
+        key=idempotency_key, operation=operation
+    ).values("target_object_id")[:1]
+    return PaymentRequest.objects.filter(id=Subquery(target)).first()
+
+
+def _lock_batch_for_creator(batch_id, creator_id, action):
+    """
+    Lock a batch the creator may modify (any batch for ADMIN).
+
+    The common case, the owner acting on their own batch, is one query that
+    locks the batch and joins the creator. Otherwise the user is loaded to
+    check for ADMIN; batches owned by someone else are never locked.
+
+    Returns:
+        tuple: (PaymentBatch, User)
+    """
+    locked_batches = PaymentBatch.objects.select_for_update(of=("self",), no_key=True)
+    try:
+        batch = locked_batches.select_related("created_by").get(
+            id=batch_id, created_by_id=creator_id
+        )
+        return batch, batch.created_by
+    except PaymentBatch.DoesNotExist:
+        pass
+
+    try:
+        creator = User.objects.only("id", "role").get(id=creator_id)
+    except User.DoesNotExist:
+        raise NotFoundError(f"User {creator_id} does not exist")
+
+    if creator.role == Role.ADMIN:
+        try:
+            return locked_batches.get(id=batch_id), creator
+        except PaymentBatch.DoesNotExist:
+            raise NotFoundError(f"PaymentBatch {batch_id} does not exist")
+    if PaymentBatch.objects.filter(id=batch_id).exists():
+        raise PermissionDeniedError(f"Only the batch creator can {action}")
+    raise NotFoundError(f"PaymentBatch {batch_id} does not exist")
+
+
 def create_batch(creator_id, title):
     """
     Create a new PaymentBatch with status DRAFT.
@@ -52,13 +116,11 @@ def create_batch(creator_id, title):
         ValidationError: If title is empty
         NotFoundError: If creator does not exist
     """
-    from apps.users.models import User
-
     if not title or not title.strip():
         raise ValidationError("Title must be non-empty")
 
     try:
-        creator = User.objects.get(id=creator_id)
+        creator = User.objects.only("id", "role").get(id=creator_id)
     except User.DoesNotExist:
         raise NotFoundError(f"User {creator_id} does not exist")
 
@@ -140,9 +202,48 @@ def add_request(
         PermissionDeniedError: If creator is not batch creator
         ValidationError: If validation fails
     """
-    from apps.users.models import User, Role
-    from apps.ledger.models import Vendor, Subcontractor, Site
-    from apps.payments.models import IdempotencyKey
+    # Determine if legacy or ledger-driven
+    is_ledger_driven = entity_type is not None
+
+    # Validate the input before touching the database, so malformed calls
+    # never take the batch lock.
+    if is_ledger_driven:
+        # Phase 2: Ledger-driven validation
+        if entity_type not in ("VENDOR", "SUBCONTRACTOR"):
+            raise ValidationError("entity_type must be VENDOR or SUBCONTRACTOR")
+        if entity_type == "VENDOR" and not vendor_id:
+            raise ValidationError("vendor_id is required when entity_type=VENDOR")
+        if entity_type == "SUBCONTRACTOR" and not subcontractor_id:
+            raise ValidationError(
+                "subcontractor_id is required when entity_type=SUBCONTRACTOR"
+            )
+        if vendor_id and subcontractor_id:
+            raise ValidationError("Cannot specify both vendor_id and subcontractor_id")
+        if not site_id:
+            raise ValidationError("site_id is required for ledger-driven requests")
+
+        # Amount validation
+        if base_amount is None or base_amount <= 0:
+            raise ValidationError("base_amount must be positive")
+        if extra_amount is None:
+            extra_amount = 0
+        if extra_amount < 0:
+            raise ValidationError("extra_amount must be non-negative")
+        if extra_amount > 0 and not extra_reason:
+            raise ValidationError("extra_reason is required when extra_amount > 0")
+    else:
+        # Phase 1: Legacy validation
+        if not amount or amount <= 0:
+            raise ValidationError("Amount must be positive")
+        if not beneficiary_name or not beneficiary_name.strip():
+            raise ValidationError("Beneficiary name must be non-empty")
+        if not beneficiary_account or not beneficiary_account.strip():
+            raise ValidationError("Beneficiary account must be non-empty")
+        if not purpose or not purpose.strip():
+            raise ValidationError("Purpose must be non-empty")
+
+    if not currency or len(currency) != 3:
+        raise ValidationError("Currency must be a three-letter code")
 
     with transaction.atomic():
         reservation = None
@@ -154,29 +255,17 @@ def add_request(
                         operation="CREATE_PAYMENT_REQUEST",
                     )
             except IntegrityError:
-                existing_key = IdempotencyKey.objects.get(
+                replayed = _replayed_request(idempotency_key, "CREATE_PAYMENT_REQUEST")
+                if replayed is not None:
+                    if _idempotency_replay is not None:
+                        _idempotency_replay.append(True)
+                    return replayed
+                reservation = IdempotencyKey.objects.get(
                     key=idempotency_key,
                     operation="CREATE_PAYMENT_REQUEST",
                 )
-                if existing_key.target_object_id:
-                    if _idempotency_replay is not None:
-                        _idempotency_replay.append(True)
-                    return PaymentRequest.objects.get(id=existing_key.target_object_id)
-                reservation = existing_key
 
-        try:
-            batch = PaymentBatch.objects.select_for_update().get(id=batch_id)
-        except PaymentBatch.DoesNotExist:
-            raise NotFoundError(f"PaymentBatch {batch_id} does not exist")
-
-        try:
-            creator = User.objects.get(id=creator_id)
-        except User.DoesNotExist:
-            raise NotFoundError(f"User {creator_id} does not exist")
-
-        # Check ownership
-        if creator.role != Role.ADMIN and batch.created_by_id != creator_id:
-            raise PermissionDeniedError("Only the batch creator can add requests")
+        batch, creator = _lock_batch_for_creator(batch_id, creator_id, "add requests")
 
         # Check batch state
         if batch.status != "DRAFT":
@@ -187,42 +276,22 @@ def add_request(
         if is_closed_batch(batch.status):
             raise InvalidStateError("Cannot add request to closed batch")
 
-        # Determine if legacy or ledger-driven
-        is_ledger_driven = entity_type is not None
-
         if is_ledger_driven:
-            # Phase 2: Ledger-driven validation
-            if entity_type not in ("VENDOR", "SUBCONTRACTOR"):
-                raise ValidationError("entity_type must be VENDOR or SUBCONTRACTOR")
-
+            # Ledger entity lookups
             if entity_type == "VENDOR":
-                if not vendor_id:
-                    raise ValidationError(
-                        "vendor_id is required when entity_type=VENDOR"
-                    )
-                if subcontractor_id:
-                    raise ValidationError(
-                        "Cannot specify both vendor_id and subcontractor_id"
-                    )
                 try:
-                    vendor = Vendor.objects.select_for_update().get(
-                        id=vendor_id, is_active=True
-                    )
+                    vendor = Vendor.objects.select_for_update(
+                        of=("self",), no_key=True
+                    ).get(id=vendor_id, is_active=True)
                 except Vendor.DoesNotExist:
                     raise NotFoundError(f"Active Vendor {vendor_id} does not exist")
                 entity_name = vendor.name
             else:  # SUBCONTRACTOR
-                if not subcontractor_id:
-                    raise ValidationError(
-                        "subcontractor_id is required when entity_type=SUBCONTRACTOR"
-                    )
-                if vendor_id:
-                    raise ValidationError(
-                        "Cannot specify both vendor_id and subcontractor_id"
-                    )
                 try:
-                    subcontractor = Subcontractor.objects.select_for_update().get(
-                        id=subcontractor_id, is_active=True
+                    subcontractor = (
+                        Subcontractor.objects.select_related("assigned_site")
+                        .select_for_update(of=("self",), no_key=True)
+                        .get(id=subcontractor_id, is_active=True)
                     )
                 except Subcontractor.DoesNotExist:
                     raise NotFoundError(
@@ -230,51 +299,23 @@ def add_request(
                     )
                 entity_name = subcontractor.name
 
-            if not site_id:
-                raise ValidationError("site_id is required for ledger-driven requests")
             try:
-                site = Site.objects.select_for_update().get(id=site_id, is_active=True)
+                site = Site.objects.select_for_update(of=("self",), no_key=True).get(
+                    id=site_id, is_active=True
+                )
             except Site.DoesNotExist:
                 raise NotFoundError(f"Active Site {site_id} does not exist")
 
-            # Amount validation
-            if base_amount is None or base_amount <= 0:
-                raise ValidationError("base_amount must be positive")
-            if extra_amount is None:
-                extra_amount = 0
-            if extra_amount < 0:
-                raise ValidationError("extra_amount must be non-negative")
-            if extra_amount > 0 and not extra_reason:
-                raise ValidationError("extra_reason is required when extra_amount > 0")
-
             # Compute total server-side
             total_amount = base_amount + extra_amount
 
-            # Soft guidance: subcontractor site override warning
-            if (
+            # Soft guidance: subcontractor site override warning (audited
+            # once the request exists)
+            site_override = (
                 entity_type == "SUBCONTRACTOR"
                 and subcontractor.assigned_site_id
-                and str(site_id) != str(subcontractor.assigned_site_id)
-            ):
-                # Create audit warning entry
-                create_audit_entry(
-                    event_type="SUBCONTRACTOR_SITE_OVERRIDE",
-                    actor_id=creator_id,
-                    entity_type="PaymentRequest",
-                    entity_id=None,  # Will be set after creation
-                    previous_state={
-                        "assigned_site_id": str(subcontractor.assigned_site_id),
-                        "assigned_site_code": subcontractor.assigned_site.code,
-                    },
-                    new_state={
-                        "selected_site_id": str(site_id),
-                        "selected_site_code": site.code,
-                    },
-                )
-
-            # Validate currency
-            if not currency or len(currency) != 3:
-                raise ValidationError("Currency must be a three-letter code")
+                and subcontractor.assigned_site_id != site.id
+            )
 
             # Populate snapshots (mandatory for ledger-driven)
             vendor_snapshot_name = vendor.name if entity_type == "VENDOR" else None
@@ -283,19 +324,6 @@ def add_request(
             )
             site_snapshot_code = site.code
 
-        else:
-            # Phase 1: Legacy validation
-            if not amount or amount <= 0:
-                raise ValidationError("Amount must be positive")
-            if not currency or len(currency) != 3:
-                raise ValidationError("Currency must be a three-letter code")
-            if not beneficiary_name or not beneficiary_name.strip():
-                raise ValidationError("Beneficiary name must be non-empty")
-            if not beneficiary_account or not beneficiary_account.strip():
-                raise ValidationError("Beneficiary account must be non-empty")
-            if not purpose or not purpose.strip():
-                raise ValidationError("Purpose must be non-empty")
-
         # Create request
         request_data = {
             "batch": batch,
@@ -343,21 +371,42 @@ def add_request(
 
         # Create audit entry
         if is_ledger_driven:
-            create_audit_entry(
-                event_type="REQUEST_CREATED",
-                actor_id=creator_id,
-                entity_type="PaymentRequest",
-                entity_id=request.id,
-                previous_state=None,
-                new_state={
-                    "status": "DRAFT",
-                    "entity_type": entity_type,
-                    "entity_name": entity_name,
-                    "site_code": site_snapshot_code,
-                    "total_amount": str(total_amount),
-                    "currency": request.currency,
-                },
+            audit_entries = []
+            if site_override:
+                audit_entries.append(
+                    {
+                        "event_type": "SUBCONTRACTOR_SITE_OVERRIDE",
+                        "actor_id": creator_id,
+                        "entity_type": "PaymentRequest",
+                        "entity_id": request.id,
+                        "previous_state": {
+                            "assigned_site_id": str(subcontractor.assigned_site_id),
+                            "assigned_site_code": subcontractor.assigned_site.code,
+                        },
+                        "new_state": {
+                            "selected_site_id": str(site.id),
+                            "selected_site_code": site.code,
+                        },
+                    }
+                )
+            audit_entries.append(
+                {
+                    "event_type": "REQUEST_CREATED",
+                    "actor_id": creator_id,
+                    "entity_type": "PaymentRequest",
+                    "entity_id": request.id,
+                    "previous_state": None,
+                    "new_state": {
+                        "status": "DRAFT",
+                        "entity_type": entity_type,
+                        "entity_name": entity_name,
+                        "site_code": site_snapshot_code,
+                        "total_amount": str(total_amount),
+                        "currency": request.currency,
+                    },
+                }
             )
+            create_audit_entries(audit_entries)
         else:
             create_audit_entry(
                 event_type="REQUEST_CREATED",
@@ -385,6 +434,7 @@ def add_request(
         return request
 
 
+@transaction.atomic
 def update_request(request_id, batch_id, creator_id, **fields):
     """
     Update a PaymentRequest (DRAFT only).
@@ -405,32 +455,36 @@ def update_request(request_id, batch_id, creator_id, **fields):
         PermissionDeniedError: If creator is not batch creator
         ValidationError: If validation fails
     """
-    from apps.users.models import User, Role
-
-    # select_for_update() requires an active transaction
-    with transaction.atomic():
-        try:
-            request = PaymentRequest.objects.select_for_update().get(id=request_id)
-        except PaymentRequest.DoesNotExist:
-            raise NotFoundError(f"PaymentRequest {request_id} does not exist")
+    # One transaction for the whole update, so the row lock is held until the
+    # write and audit entry are committed.
+    try:
+        request = (
+            PaymentRequest.objects.select_related("batch__created_by")
+            .select_for_update(of=("self",), no_key=True)
+            .get(id=request_id)
+        )
+    except PaymentRequest.DoesNotExist:
+        raise NotFoundError(f"PaymentRequest {request_id} does not exist")
 
     # Check request state first so PATCH after approve returns 409
     if request.status != "DRAFT":
         raise InvalidStateError(f"Cannot update request with status {request.status}")
 
-    if str(request.batch_id) != str(batch_id):
+    if not _matches_id(request.batch_id, batch_id):
         raise NotFoundError(
             f"PaymentRequest {request_id} does not belong to batch {batch_id}"
         )
 
-    try:
-        creator = User.objects.get(id=creator_id)
-    except User.DoesNotExist:
-        raise NotFoundError(f"User {creator_id} does not exist")
-
-    # Check ownership
-    if creator.role != Role.ADMIN and request.batch.created_by_id != creator_id:
-        raise PermissionDeniedError("Only the batch creator can update requests")
+    # Check ownership (the batch creator was joined above)
+    if _matches_id(request.batch.created_by_id, creator_id):
+        creator = request.batch.created_by
+    else:
+        try:
+            creator = User.objects.only("id", "role").get(id=creator_id)
+        except User.DoesNotExist:
+            raise NotFoundError(f"User {creator_id} does not exist")
+        if creator.role != Role.ADMIN:
+            raise PermissionDeniedError("Only the batch creator can update requests")
 
     # Check batch state
     if is_closed_batch(request.batch.status):
@@ -475,29 +529,34 @@ def update_request(request_id, batch_id, creator_id, **fields):
             raise ValidationError("Purpose must be non-empty")
         request.purpose = purpose.strip()
 
-    with transaction.atomic():
-        request.updated_by = creator
-        request.save()
-
-        # Create audit entry
-        new_state = {
-            "amount": str(request.amount),
-            "currency": request.currency,
-            "beneficiary_name": request.beneficiary_name,
-            "beneficiary_account": request.beneficiary_account,
-            "purpose": request.purpose,
-        }
+    request.updated_by = creator
+    request.save(
+        update_fields=[
+            *(name for name in previous_state if name in fields),
+            "updated_by",
+            "updated_at",
+        ]
+    )
+
+    # Create audit entry
+    new_state = {
+        "amount": str(request.amount),
+        "currency": request.currency,
+        "beneficiary_name": request.beneficiary_name,
+        "beneficiary_account": request.beneficiary_account,
+        "purpose": request.purpose,
+    }
 
-        create_audit_entry(
-            event_type="REQUEST_UPDATED",
-            actor_id=creator_id,
-            entity_type="PaymentRequest",
-            entity_id=request.id,
-            previous_state=previous_state,
-            new_state=new_state,
-        )
+    create_audit_entry(
+        event_type="REQUEST_UPDATED",
+        actor_id=creator_id,
+        entity_type="PaymentRequest",
+        entity_id=request.id,
+        previous_state=previous_state,
+        new_state=new_state,
+    )
 
-        return request
+    return request
 
 
 def submit_batch(batch_id, creator_id):
@@ -517,22 +576,10 @@ def submit_batch(batch_id, creator_id):
         PermissionDeniedError: If creator is not batch creator
         PreconditionFailedError: If batch is empty or invalid
     """
-    from apps.users.models import User, Role
-
     with transaction.atomic():
-        try:
-            batch = PaymentBatch.objects.select_for_update().get(id=batch_id)
-        except PaymentBatch.DoesNotExist:
-            raise NotFoundError(f"PaymentBatch {batch_id} does not exist")
-
-        try:
-            creator = User.objects.get(id=creator_id)
-        except User.DoesNotExist:
-            raise NotFoundError(f"User {creator_id} does not exist")
-
-        # Check ownership
-        if creator.role != Role.ADMIN and batch.created_by_id != creator_id:
-            raise PermissionDeniedError("Only the batch creator can submit the batch")
+        batch, creator = _lock_batch_for_creator(
+            batch_id, creator_id, "submit the batch"
+        )
 
         # Check batch state
         if batch.status != "DRAFT":
@@ -544,7 +591,7 @@ def submit_batch(batch_id, creator_id):
         # Get all requests with lock (consistent order by id)
         requests = list(
             PaymentRequest.objects.filter(batch=batch)
-            .select_for_update()
+            .select_for_update(of=("self",), no_key=True)
             .order_by("id")
         )
 
@@ -590,65 +637,73 @@ def submit_batch(batch_id, creator_id):
             if not req.currency or len(req.currency) != 3:
                 raise PreconditionFailedError(f"Request {req.id} has invalid currency")
 
-        # Update batch
+        # Update batch: DRAFT -> SUBMITTED -> PROCESSING. SUBMITTED is
+        # immediately followed by the system transition, so only the final
+        # state is written (one UPDATE); both transitions are audited below.
+        validate_transition("PaymentBatch", batch.status, "SUBMITTED")
+        validate_transition("PaymentBatch", "SUBMITTED", "PROCESSING")
         now = timezone.now()
-        batch.status = "SUBMITTED"
+        batch.status = "PROCESSING"
         batch.submitted_at = now
-        batch.save()
-
-        # Create audit entry for batch
-        create_audit_entry(
-            event_type="BATCH_SUBMITTED",
-            actor_id=creator_id,
-            entity_type="PaymentBatch",
-            entity_id=batch.id,
-            previous_state={"status": "DRAFT"},
-            new_state={"status": "SUBMITTED", "submitted_at": now.isoformat()},
+        batch.save(update_fields=["status", "submitted_at"])
+
+        # Transition all requests: DRAFT -> SUBMITTED -> PENDING_APPROVAL,
+        # likewise writing only the final state. Every request was checked
+        # to be DRAFT above, so each phase is validated once rather than per
+        # request.
+        validate_transition("PaymentRequest", "DRAFT", "SUBMITTED")
+        validate_transition("PaymentRequest", "SUBMITTED", "PENDING_APPROVAL")
+        PaymentRequest.bulk_update_status(
+            requests, "PENDING_APPROVAL", updated_by=creator
         )
 
-        # Transition all requests: DRAFT -> SUBMITTED -> PENDING_APPROVAL
-        for req in requests:
-            # Transition to SUBMITTED
-            validate_transition("PaymentRequest", req.status, "SUBMITTED")
-            req.status = "SUBMITTED"
-            req.updated_by = creator
-            req.save()
-
-            create_audit_entry(
-                event_type="REQUEST_SUBMITTED",
-                actor_id=creator_id,
-                entity_type="PaymentRequest",
-                entity_id=req.id,
-                previous_state={"status": "DRAFT"},
-                new_state={"status": "SUBMITTED"},
-            )
-
-            # Transition to PENDING_APPROVAL (system transition)
-            validate_transition("PaymentRequest", req.status, "PENDING_APPROVAL")
-            req.status = "PENDING_APPROVAL"
-            req.save()
-
-            create_audit_entry(
-                event_type="REQUEST_SUBMITTED",
-                actor_id=None,  # System transition
-                entity_type="PaymentRequest",
-                entity_id=req.id,
-                previous_state={"status": "SUBMITTED"},
-                new_state={"status": "PENDING_APPROVAL"},
-            )
-
-        # Transition batch to PROCESSING
-        validate_transition("PaymentBatch", batch.status, "PROCESSING")
-        batch.status = "PROCESSING"
-        batch.save()
-
-        create_audit_entry(
-            event_type="BATCH_SUBMITTED",
-            actor_id=None,  # System transition
-            entity_type="PaymentBatch",
-            entity_id=batch.id,
-            previous_state={"status": "SUBMITTED"},
-            new_state={"status": "PROCESSING"},
+        # Audit every batch and request transition with one INSERT
+        create_audit_entries(
+            [
+                {
+                    "event_type": "BATCH_SUBMITTED",
+                    "actor_id": creator_id,
+                    "entity_type": "PaymentBatch",
+                    "entity_id": batch.id,
+                    "previous_state": {"status": "DRAFT"},
+                    "new_state": {
+                        "status": "SUBMITTED",
+                        "submitted_at": now.isoformat(),
+                    },
+                }
+            ]
+            + [
+                {
+                    "event_type": "REQUEST_SUBMITTED",
+                    "actor_id": creator_id,
+                    "entity_type": "PaymentRequest",
+                    "entity_id": req.id,
+                    "previous_state": {"status": "DRAFT"},
+                    "new_state": {"status": "SUBMITTED"},
+                }
+                for req in requests
+            ]
+            + [
+                {
+                    "event_type": "REQUEST_SUBMITTED",
+                    "actor_id": None,  # System transition
+                    "entity_type": "PaymentRequest",
+                    "entity_id": req.id,
+                    "previous_state": {"status": "SUBMITTED"},
+                    "new_state": {"status": "PENDING_APPROVAL"},
+                }
+                for req in requests
+            ]
+            + [
+                {
+                    "event_type": "BATCH_SUBMITTED",
+                    "actor_id": None,  # System transition
+                    "entity_type": "PaymentBatch",
+                    "entity_id": batch.id,
+                    "previous_state": {"status": "SUBMITTED"},
+                    "new_state": {"status": "PROCESSING"},
+                }
+            ]
         )
 
         logger.info(
@@ -679,36 +734,56 @@ def cancel_batch(batch_id, creator_id):
         InvalidStateError: If batch is not DRAFT
         PermissionDeniedError: If creator is not batch creator
     """
-    from apps.users.models import User, Role
-
-    try:
-        creator = User.objects.get(id=creator_id)
-    except User.DoesNotExist:
-        raise NotFoundError(f"User {creator_id} does not exist")
-    # Ensure creator existence is enforced even if not otherwise referenced.
-    creator.pk
-
     with transaction.atomic():
+        now = timezone.now()
+        cancel_fields = {
+            # Constraint: non-DRAFT requires submitted_at
+            "submitted_at": now,
+            "completed_at": now,
+        }
+        # Status and ownership are checked in the UPDATE itself. The batch
+        # creator cancelling their own batch therefore needs no user lookup;
+        # the user is only loaded (for the ADMIN bypass) when that misses.
+        updated = atomic_transition(
+            PaymentBatch,
+            batch_id,
+            "DRAFT",
+            "CANCELLED",
+            extra_fields=cancel_fields,
+            owner_field="created_by_id",
+            owner_id=creator_id,
+        )
+        if not updated:
+            try:
+                creator = User.objects.only("id", "role").get(id=creator_id)
+            except User.DoesNotExist:
+                raise NotFoundError(f"User {creator_id} does not exist")
+            if creator.role == Role.ADMIN:
+                updated = atomic_transition(
+                    PaymentBatch,
+                    batch_id,
+                    "DRAFT",
+                    "CANCELLED",
+                    extra_fields=cancel_fields,
+                )
+
         try:
-            batch = PaymentBatch.objects.select_for_update().get(id=batch_id)
+            batch = PaymentBatch.objects.get(id=batch_id)
         except PaymentBatch.DoesNotExist:
             raise NotFoundError(f"PaymentBatch {batch_id} does not exist")
 
-        # Check ownership
-        if creator.role != Role.ADMIN and batch.created_by_id != creator_id:
-            raise PermissionDeniedError("Only the batch creator can cancel the batch")
-
-        # Check batch state
-        if batch.status != "DRAFT":
+        if not updated:
+            # Check ownership
+            if creator.role != Role.ADMIN and not _matches_id(
+                batch.created_by_id, creator_id
+            ):
+                raise PermissionDeniedError(
+                    "Only the batch creator can cancel the batch"
+                )
             # Idempotency: if already CANCELLED, return success
             if batch.status == "CANCELLED":
                 return batch
             raise InvalidStateError(f"Cannot cancel batch with status {batch.status}")
-        now = timezone.now()
-        batch.status = "CANCELLED"
-        batch.submitted_at = now  # Constraint: non-DRAFT requires submitted_at
-        batch.completed_at = now
-        batch.save()
 
         # Create audit entry
         create_audit_entry(
@@ -757,9 +832,6 @@ def approve_request(
         PermissionDeniedError: If approver does not have APPROVER role
         PreconditionFailedError: If ApprovalRecord already exists
     """
-    from apps.users.models import User, Role
-    from apps.payments.models import IdempotencyKey
-
     with transaction.atomic():
         reservation = None
         if idempotency_key:
@@ -770,28 +842,32 @@ def approve_request(
                         operation="APPROVE_PAYMENT_REQUEST",
                     )
             except IntegrityError:
-                existing_key = IdempotencyKey.objects.get(
+                replayed = _replayed_request(idempotency_key, "APPROVE_PAYMENT_REQUEST")
+                if replayed is not None:
+                    if _idempotency_replay is not None:
+                        _idempotency_replay.append(True)
+                    return replayed
+                reservation = IdempotencyKey.objects.get(
                     key=idempotency_key,
                     operation="APPROVE_PAYMENT_REQUEST",
                 )
-                if existing_key.target_object_id:
-                    if _idempotency_replay is not None:
-                        _idempotency_replay.append(True)
-                    return PaymentRequest.objects.get(id=existing_key.target_object_id)
-                reservation = existing_key
 
         try:
-            request = PaymentRequest.objects.select_for_update().get(id=request_id)
+            request = PaymentRequest.objects.select_for_update(
+                of=("self",), no_key=True
+            ).get(id=request_id)
         except PaymentRequest.DoesNotExist:
             raise NotFoundError(f"PaymentRequest {request_id} does not exist")
 
         try:
-            approver = User.objects.get(id=approver_id)
+            approver_role = User.objects.values_list("role", flat=True).get(
+                id=approver_id
+            )
         except User.DoesNotExist:
             raise NotFoundError(f"User {approver_id} does not exist")
 
         # Check role (ADMIN can approve as well)
-        if approver.role not in (Role.APPROVER, Role.ADMIN):
+        if approver_role not in (Role.APPROVER, Role.ADMIN):
             raise PermissionDeniedError(
                 "Only users with APPROVER or ADMIN role can approve requests"
             )
@@ -822,7 +898,7 @@ def approve_request(
         try:
             ApprovalRecord.objects.create(
                 payment_request=request,
-                approver=approver,
+                approver_id=approver_id,
                 decision="APPROVED",
                 comment=comment.strip() if comment else None,
             )
@@ -845,13 +921,17 @@ def approve_request(
             ),
             current_version=current_version,
             status="APPROVED",
-            updated_by=approver,
+            updated_by_id=approver_id,
         )
         if updated_count == 0:
             raise InvalidStateError(
                 "Concurrent modification detected or invalid state for approval"
             )
-        request.refresh_from_db()
+        # The row is locked and the UPDATE matched current_version, so its new
+        # values are known; no need to read them back.
+        request.status = "APPROVED"
+        request.version = current_version + 1
+        request.updated_by_id = approver_id
 
         if idempotency_key:
             reservation.target_object_id = request.id
@@ -905,9 +985,6 @@ def reject_request(
         PermissionDeniedError: If approver does not have APPROVER role
         PreconditionFailedError: If ApprovalRecord already exists
     """
-    from apps.users.models import User, Role
-    from apps.payments.models import IdempotencyKey
-
     with transaction.atomic():
         reservation = None
         if idempotency_key:
@@ -918,28 +995,32 @@ def reject_request(
                         operation="REJECT_PAYMENT_REQUEST",
                     )
             except IntegrityError:
-                existing_key = IdempotencyKey.objects.get(
+                replayed = _replayed_request(idempotency_key, "REJECT_PAYMENT_REQUEST")
+                if replayed is not None:
+                    if _idempotency_replay is not None:
+                        _idempotency_replay.append(True)
+                    return replayed
+                reservation = IdempotencyKey.objects.get(
                     key=idempotency_key,
                     operation="REJECT_PAYMENT_REQUEST",
                 )
-                if existing_key.target_object_id:
-                    if _idempotency_replay is not None:
-                        _idempotency_replay.append(True)
-                    return PaymentRequest.objects.get(id=existing_key.target_object_id)
-                reservation = existing_key
 
         try:
-            approver = User.objects.get(id=approver_id)
+            approver_role = User.objects.values_list("role", flat=True).get(
+                id=approver_id
+            )
         except User.DoesNotExist:
             raise NotFoundError(f"User {approver_id} does not exist")
 
-        if approver.role not in (Role.APPROVER, Role.ADMIN):
+        if approver_role not in (Role.APPROVER, Role.ADMIN):
             raise PermissionDeniedError(
                 "Only users with APPROVER or ADMIN role can reject requests"
             )
 
         try:
-            request = PaymentRequest.objects.select_for_update().get(id=request_id)
+            request = PaymentRequest.objects.select_for_update(
+                of=("self",), no_key=True
+            ).get(id=request_id)
         except PaymentRequest.DoesNotExist:
             raise NotFoundError(f"PaymentRequest {request_id} does not exist")
 
@@ -970,7 +1051,7 @@ def reject_request(
         try:
             ApprovalRecord.objects.create(
                 payment_request=request,
-                approver=approver,
+                approver_id=approver_id,
                 decision="REJECTED",
                 comment=comment.strip() if comment else None,
             )
@@ -991,13 +1072,17 @@ def reject_request(
             ),
             current_version=current_version,
             status="REJECTED",
-            updated_by=approver,
+            updated_by_id=approver_id,
         )
         if updated_count == 0:
             raise InvalidStateError(
                 "Concurrent modification detected or invalid state for rejection"
             )
-        request.refresh_from_db()
+        # The row is locked and the UPDATE matched current_version, so its new
+        # values are known; no need to read them back.
+        request.status = "REJECTED"
+        request.version = current_version + 1
+        request.updated_by_id = approver_id
 
         if idempotency_key:
             reservation.target_object_id = request.id
@@ -1043,9 +1128,6 @@ def mark_paid(request_id, actor_id, idempotency_key=None, _idempotency_replay=No
         InvalidStateError: If request is not APPROVED
         PermissionDeniedError: If actor does not have required role
     """
-    from apps.users.models import User
-    from apps.payments.models import IdempotencyKey
-
     with transaction.atomic():
         reservation = None
         if idempotency_key:
@@ -1056,28 +1138,32 @@ def mark_paid(request_id, actor_id, idempotency_key=None, _idempotency_replay=No
                         operation="MARK_PAYMENT_PAID",
                     )
             except IntegrityError:
-                existing_key = IdempotencyKey.objects.get(
+                replayed = _replayed_request(idempotency_key, "MARK_PAYMENT_PAID")
+                if replayed is not None:
+                    if _idempotency_replay is not None:
+                        _idempotency_replay.append(True)
+                    return replayed
+                reservation = IdempotencyKey.objects.get(
                     key=idempotency_key,
                     operation="MARK_PAYMENT_PAID",
                 )
-                if existing_key.target_object_id:
-                    if _idempotency_replay is not None:
-                        _idempotency_replay.append(True)
-                    return PaymentRequest.objects.get(id=existing_key.target_object_id)
-                reservation = existing_key
 
         try:
-            actor = User.objects.get(id=actor_id)
+            actor_role = User.objects.values_list("role", flat=True).get(id=actor_id)
         except User.DoesNotExist:
             raise NotFoundError(f"User {actor_id} does not exist")
 
-        if actor.role not in ("CREATOR", "APPROVER", "ADMIN"):
+        if actor_role not in ("CREATOR", "APPROVER", "ADMIN"):
             raise PermissionDeniedError(
                 "Only CREATOR, APPROVER, or ADMIN can mark requests as paid"
             )
 
         try:
-            request = PaymentRequest.objects.select_for_update().get(id=request_id)
+            request = (
+                PaymentRequest.objects.select_related("batch")
+                .select_for_update(of=("self",), no_key=True)
+                .get(id=request_id)
+            )
         except PaymentRequest.DoesNotExist:
             raise NotFoundError(f"PaymentRequest {request_id} does not exist")
 
@@ -1104,13 +1190,17 @@ def mark_paid(request_id, actor_id, idempotency_key=None, _idempotency_replay=No
             ),
             current_version=current_version,
             status="PAID",
-            updated_by=actor,
+            updated_by_id=actor_id,
         )
         if updated_count == 0:
             raise InvalidStateError(
                 "Concurrent modification detected or invalid state for mark_paid"
             )
-        request.refresh_from_db()
+        # The row is locked and the UPDATE matched current_version, so its new
+        # values are known; no need to read them back.
+        request.status = "PAID"
+        request.version = current_version + 1
+        request.updated_by_id = actor_id
 
         if idempotency_key:
             reservation.target_object_id = request.id
@@ -1139,17 +1229,17 @@ def mark_paid(request_id, actor_id, idempotency_key=None, _idempotency_replay=No
         # Check if batch should transition to COMPLETED
         batch = request.batch
         if batch.status == "PROCESSING":
-            # Check if all requests are terminal
-            all_terminal = all(
-                req.status in ("APPROVED", "REJECTED", "PAID")
-                for req in batch.requests.all()
-            )
+            # Check if all requests are terminal (index-only scan on
+            # idx_req_batch_status_cov instead of loading every request)
+            all_terminal = not batch.requests.exclude(
+                status__in=("APPROVED", "REJECTED", "PAID")
+            ).exists()
 
             if all_terminal:
                 validate_transition("PaymentBatch", batch.status, "COMPLETED")
                 batch.status = "COMPLETED"
                 batch.completed_at = timezone.now()
-                batch.save()
+                batch.save(update_fields=["status", "completed_at"])
 
                 create_audit_entry(
                     event_type="BATCH_COMPLETED",
@@ -1172,8 +1262,13 @@ def mark_paid(request_id, actor_id, idempotency_key=None, _idempotency_replay=No
                         "user_id": None,
                     },
                 )
-                # Auto-generate SOA when batch completes (original canonical flow)
-                generate_soa_for_batch(batch.id)
+                # Auto-generate SOA when batch completes (original canonical
+                # flow). Rendering the PDF is slow, so it runs once this
+                # transaction has committed and released its row locks.
+                transaction.on_commit(
+                    lambda batch_id=batch.id: _generate_soa_after_commit(batch_id),
+                    robust=True,
+                )
 
         return request
 
@@ -1197,12 +1292,8 @@ def upload_soa(batch_id, request_id, creator_id, file):
         PermissionDeniedError: If creator is not batch creator
         ValidationError: If file is missing
     """
-    from apps.users.models import User, Role
-    from django.core.files.storage import default_storage
-    from django.core.files.base import ContentFile
-
     try:
-        creator = User.objects.get(id=creator_id)
+        creator = User.objects.only("id", "role").get(id=creator_id)
     except User.DoesNotExist:
         raise NotFoundError(f"User {creator_id} does not exist")
 
@@ -1211,11 +1302,15 @@ def upload_soa(batch_id, request_id, creator_id, file):
 
     with transaction.atomic():
         try:
-            request = PaymentRequest.objects.select_for_update().get(id=request_id)
+            request = (
+                PaymentRequest.objects.select_related("batch")
+                .select_for_update(of=("self",), no_key=True)
+                .get(id=request_id)
+            )
         except PaymentRequest.DoesNotExist:
             raise NotFoundError(f"PaymentRequest {request_id} does not exist")
 
-        if str(request.batch_id) != str(batch_id):
+        if not _matches_id(request.batch_id, batch_id):
             raise NotFoundError(
                 f"PaymentRequest {request_id} does not belong to batch {batch_id}"
             )
@@ -1234,17 +1329,15 @@ def upload_soa(batch_id, request_id, creator_id, file):
         if is_closed_batch(request.batch.status):
             raise InvalidStateError("Cannot upload SOA for request in closed batch")
         # Calculate next version number
-        existing_versions = SOAVersion.objects.filter(payment_request=request).order_by(
-            "-version_number"
-        )
-        if existing_versions.exists():
-            next_version = existing_versions.first().version_number + 1
-        else:
-            next_version = 1
+        latest_version = SOAVersion.objects.filter(payment_request=request).aggregate(
+            latest=Max("version_number")
+        )["latest"]
+        next_version = (latest_version or 0) + 1
 
         # Store file (simplified - in production use proper storage backend)
         file_name = f"soa/{request_id}/{next_version}_{file.name}"
-        file_path = default_storage.save(file_name, ContentFile(file.read()))
+        # Storage writes the upload chunk by chunk instead of one bytes copy
+        file_path = default_storage.save(file_name, file)
 
         # Create SOAVersion (user upload)
         soa_version = SOAVersion.objects.create(
@@ -1268,13 +1361,36 @@ def upload_soa(batch_id, request_id, creator_id, file):
         return soa_version
 
 
+def _generate_soa_after_commit(batch_id):
+    """
+    Run generate_soa_for_batch for a batch whose completion has committed.
+
+    The payment is already durable at this point, so a failure is logged
+    rather than raised; the generate_missing_soas command picks the batch
+    up again.
+    """
+    try:
+        generate_soa_for_batch(batch_id)
+    except Exception:
+        logger.exception(
+            "soa_generation_failed",
+            extra={
+                "request_id": get_current_request_id(),
+                "entity_id": str(batch_id),
+                "operation": "SOA_GENERATED",
+                "user_id": None,
+            },
+        )
+
+
 def generate_soa_for_batch(batch_id):
     """
     Auto-generate SOA when batch reaches COMPLETED.
     System creates SOA document; no manual step.
     Audit: SOA_GENERATED (actor=None for system event).
 
-    Idempotent: skips if batch already has generated SOA.
+    Idempotent: skips unless the batch is COMPLETED and has no generated
+    SOA yet, checked under a row lock on the batch.
 
     Args:
         batch_id: PaymentBatch identifier
@@ -1282,50 +1398,58 @@ def generate_soa_for_batch(batch_id):
     Returns:
         list[SOAVersion]: Created SOA versions (one per request), or empty if skipped
     """
-    from django.core.files.base import ContentFile
-    from django.core.files.storage import default_storage
-
-    from apps.payments.soa_export import export_batch_soa_pdf
-
-    try:
-        batch = PaymentBatch.objects.get(id=batch_id)
-    except PaymentBatch.DoesNotExist:
-        return []
+    from apps.payments.soa_export import write_batch_soa_pdf
 
-    # Idempotency: skip if already generated
-    has_generated = SOAVersion.objects.filter(
-        payment_request__batch_id=batch_id,
-        source=SOAVersion.SOURCE_GENERATED,
-    ).exists()
-    if has_generated:
-        return []
-
-    # Generate PDF
-    content, filename = export_batch_soa_pdf(batch_id)
-
-    # Store file (single file for batch, referenced by each request)
-    file_path = f"soa/generated/{batch_id}/batch_soa.pdf"
-    default_storage.save(file_path, ContentFile(content))
-
-    created = []
+    # Runs after mark_paid commits and from generate_missing_soas; the batch
+    # row lock serialises the two, and reads inside the transaction go to
+    # the primary rather than a replica that may not have the completion yet.
     with transaction.atomic():
-        for request in batch.requests.all():
-            # Next version for this request
-            existing = SOAVersion.objects.filter(payment_request=request).order_by(
-                "-version_number"
-            )
-            next_version = (
-                existing.first().version_number + 1 if existing.exists() else 1
-            )
+        try:
+            batch = PaymentBatch.objects.select_for_update().get(id=batch_id)
+        except PaymentBatch.DoesNotExist:
+            return []
+        if batch.status != "COMPLETED":
+            return []
+
+        # Idempotency: skip if already generated
+        has_generated = SOAVersion.objects.filter(
+            payment_request__batch_id=batch_id,
+            source=SOAVersion.SOURCE_GENERATED,
+        ).exists()
+        if has_generated:
+            return []
+
+        # Generate PDF and hand the buffer to storage as is (no extra copy)
+        buffer = io.BytesIO()
+        write_batch_soa_pdf(batch_id, buffer, using="default")
+
+        # Store file (single file for batch, referenced by each request).
+        # Storage may pick another name if the path is taken, e.g. by a run
+        # that failed after saving; reference the name it actually used.
+        file_path = default_storage.save(
+            f"soa/generated/{batch_id}/batch_soa.pdf", File(buffer)
+        )
 
-            soa_version = SOAVersion.objects.create(
-                payment_request=request,
-                version_number=next_version,
-                document_reference=file_path,
-                source=SOAVersion.SOURCE_GENERATED,
-                uploaded_by=None,  # System-generated
-            )
-            created.append(soa_version)
+        # Latest version per request, in one grouped query
+        latest_versions = dict(
+            SOAVersion.objects.filter(payment_request__batch_id=batch_id)
+            .values("payment_request_id")
+            .annotate(latest=Max("version_number"))
+            .values_list("payment_request_id", "latest")
+        )
+        created = SOAVersion.objects.bulk_create(
+            [
+                SOAVersion(
+                    payment_request_id=request_id,
+                    version_number=latest_versions.get(request_id, 0) + 1,
+                    document_reference=file_path,
+                    source=SOAVersion.SOURCE_GENERATED,
+                    uploaded_by=None,  # System-generated
+                )
+                for request_id in batch.requests.values_list("id", flat=True)
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
 
         # Audit: SOA_GENERATED (system event, no actor)
         create_audit_entry(
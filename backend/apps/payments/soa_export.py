@@ -8,7 +8,7 @@ All business rules enforced at view layer; this module is pure I/O.
 import io
 from datetime import datetime
 
-from django.db.models import Sum
+from django.db.models import Prefetch, Sum
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -23,29 +23,69 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER
 
-from apps.payments.models import PaymentBatch
+from apps.payments.models import PaymentBatch, PaymentRequest, SOAVersion
 
 
-def _get_batch_export_data(batch_id):
-    """Fetch batch with requests and SOA versions for export."""
+def _get_batch_export_data(batch_id, using=None):
+    """
+    Fetch batch with requests and SOA versions for export.
+
+    The batch carries its request total as ``batch_total``. Requests and
+    their SOA versions are prefetched already in export order, so the
+    exporters iterate ``.all()`` without issuing further queries. ``using``
+    pins the reads to a database alias (default: routed).
+    """
+    soa_versions = (
+        SOAVersion.objects.select_related("uploaded_by")
+        .only(
+            "payment_request",
+            "version_number",
+            "uploaded_at",
+            "uploaded_by__display_name",
+            "uploaded_by__username",
+        )
+        .order_by("version_number")
+    )
+    requests = PaymentRequest.objects.order_by("created_at").prefetch_related(
+        Prefetch("soa_versions", queryset=soa_versions)
+    )
     batch = (
-        PaymentBatch.objects.prefetch_related("requests__soa_versions__uploaded_by")
+        PaymentBatch.objects.using(using)
         .select_related("created_by")
+        .annotate(batch_total=Sum("requests__amount"))
+        .prefetch_related(Prefetch("requests", queryset=requests))
         .get(id=batch_id)
     )
     return batch
 
 
+def _uploader_name(soa):
+    """Name shown for who uploaded an SOA version ("System" if generated)."""
+    user = soa.uploaded_by
+    if user is None:
+        return "System"
+    return user.display_name or user.username
+
+
 def export_batch_soa_pdf(batch_id):
     """
     Generate PDF export of batch SOA (immutable snapshot).
     Returns (bytes, filename).
     """
-    batch = _get_batch_export_data(batch_id)
-
     buffer = io.BytesIO()
+    filename = write_batch_soa_pdf(batch_id, buffer)
+    return buffer.getvalue(), filename
+
+
+def write_batch_soa_pdf(batch_id, out, using=None):
+    """
+    Render the batch SOA PDF into the binary file-like object ``out``.
+    Returns the export filename.
+    """
+    batch = _get_batch_export_data(batch_id, using=using)
+
     doc = SimpleDocTemplate(
-        buffer,
+        out,
         pagesize=letter,
         rightMargin=inch,
         leftMargin=inch,
@@ -122,9 +162,9 @@ def export_batch_soa_pdf(batch_id):
     # Requests and SOA
     story.append(Paragraph("Payment Requests & SOA Versions", heading_style))
 
-    total = batch.requests.aggregate(s=Sum("amount"))["s"] or 0
+    total = batch.batch_total or 0
 
-    for req in batch.requests.all().order_by("created_at"):
+    for req in batch.requests.all():
         story.append(
             Paragraph(
                 f"<b>{req.beneficiary_name}</b> - "
@@ -134,20 +174,15 @@ def export_batch_soa_pdf(batch_id):
         )
         story.append(Spacer(1, 4))
 
-        soas = req.soa_versions.all().order_by("version_number")
+        soas = req.soa_versions.all()
         if soas:
             soa_rows = [["Version", "Uploaded At", "Uploaded By"]]
             for soa in soas:
-                uploader = (
-                    (soa.uploaded_by.display_name or soa.uploaded_by.username)
-                    if soa.uploaded_by
-                    else "System"
-                )
                 soa_rows.append(
                     [
                         str(soa.version_number),
                         soa.uploaded_at.strftime("%Y-%m-%d %H:%M"),
-                        uploader,
+                        _uploader_name(soa),
                     ]
                 )
             soa_table = Table(soa_rows, colWidths=[1 * inch, 2 * inch, 2 * inch])
@@ -179,26 +214,33 @@ def export_batch_soa_pdf(batch_id):
     )
 
     doc.build(story)
-    buffer.seek(0)
 
     ts = datetime.utcnow().strftime("%Y%m%d_%H%M")
-    filename = f"soa_export_{batch.title.replace(' ', '_')}_{ts}.pdf"
-    return buffer.read(), filename
+    return f"soa_export_{batch.title.replace(' ', '_')}_{ts}.pdf"
 
 
 def export_batch_soa_excel(batch_id):
     """
     Generate Excel export of batch SOA (immutable snapshot).
     Returns (bytes, filename).
+
+    The workbook is written in openpyxl's write-only mode: rows are appended
+    in order and streamed out rather than kept as cell objects, so memory
+    stays flat for large batches.
     """
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Border, Side
+    from openpyxl.utils import get_column_letter
 
     batch = _get_batch_export_data(batch_id)
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "SOA Export"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("SOA Export")
+
+    # Column widths
+    for col in range(1, 9):
+        ws.column_dimensions[get_column_letter(col)].width = 18
 
     header_font = Font(bold=True)
     header_fill = PatternFill(
@@ -211,27 +253,26 @@ def export_batch_soa_excel(batch_id):
         bottom=Side(style="thin"),
     )
 
-    row = 1
+    def styled(value, font=None, fill=None, border=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if border:
+            cell.border = border
+        return cell
 
     # Batch info
-    ws.cell(row=row, column=1, value="Batch Information").font = header_font
-    row += 1
-    ws.cell(row=row, column=1, value="Batch ID")
-    ws.cell(row=row, column=2, value=str(batch.id))
-    row += 1
-    ws.cell(row=row, column=1, value="Title")
-    ws.cell(row=row, column=2, value=batch.title)
-    row += 1
-    ws.cell(row=row, column=1, value="Status")
-    ws.cell(row=row, column=2, value=batch.status)
-    row += 1
-    ws.cell(row=row, column=1, value="Created")
-    ws.cell(row=row, column=2, value=batch.created_at.strftime("%Y-%m-%d %H:%M"))
-    row += 2
+    ws.append([styled("Batch Information", font=header_font)])
+    ws.append(["Batch ID", str(batch.id)])
+    ws.append(["Title", batch.title])
+    ws.append(["Status", batch.status])
+    ws.append(["Created", batch.created_at.strftime("%Y-%m-%d %H:%M")])
+    ws.append([])
 
     # Requests table
-    ws.cell(row=row, column=1, value="Payment Requests & SOA").font = header_font
-    row += 1
+    ws.append([styled("Payment Requests & SOA", font=header_font)])
     headers = [
         "Beneficiary",
         "Amount",
@@ -242,72 +283,63 @@ def export_batch_soa_excel(batch_id):
         "SOA Uploaded At",
         "SOA Uploaded By",
     ]
-    for col, h in enumerate(headers, 1):
-        c = ws.cell(row=row, column=col, value=h)
-        c.font = header_font
-        c.fill = header_fill
-        c.border = thin_border
-    row += 1
-
-    total = 0
-    for req in batch.requests.all().order_by("created_at"):
-        total += float(req.amount)
-        soas = list(
-            req.soa_versions.select_related("uploaded_by").order_by("version_number")
-        )
+    ws.append(
+        [
+            styled(h, font=header_font, fill=header_fill, border=thin_border)
+            for h in headers
+        ]
+    )
+
+    total = float(batch.batch_total or 0)
+    for req in batch.requests.all():
+        request_values = [
+            req.beneficiary_name,
+            float(req.amount),
+            req.currency,
+            req.purpose,
+            req.status,
+        ]
+        soas = req.soa_versions.all()
         if soas:
             for soa in soas:
-                ws.cell(row=row, column=1, value=req.beneficiary_name)
-                ws.cell(row=row, column=2, value=float(req.amount))
-                ws.cell(row=row, column=3, value=req.currency)
-                ws.cell(row=row, column=4, value=req.purpose)
-                ws.cell(row=row, column=5, value=req.status)
-                ws.cell(row=row, column=6, value=soa.version_number)
-                ws.cell(
-                    row=row, column=7, value=soa.uploaded_at.strftime("%Y-%m-%d %H:%M")
-                )
-                uploader = (
-                    (soa.uploaded_by.display_name or soa.uploaded_by.username)
-                    if soa.uploaded_by
-                    else "System"
+                soa_values = [
+                    soa.version_number,
+                    soa.uploaded_at.strftime("%Y-%m-%d %H:%M"),
+                    _uploader_name(soa),
+                ]
+                ws.append(
+                    [
+                        styled(value, border=thin_border)
+                        for value in request_values + soa_values
+                    ]
                 )
-                ws.cell(row=row, column=8, value=uploader)
-                for col in range(1, 9):
-                    ws.cell(row=row, column=col).border = thin_border
-                row += 1
         else:
-            ws.cell(row=row, column=1, value=req.beneficiary_name)
-            ws.cell(row=row, column=2, value=float(req.amount))
-            ws.cell(row=row, column=3, value=req.currency)
-            ws.cell(row=row, column=4, value=req.purpose)
-            ws.cell(row=row, column=5, value=req.status)
-            ws.cell(row=row, column=6, value="—")
-            ws.cell(row=row, column=7, value="—")
-            ws.cell(row=row, column=8, value="—")
-            for col in range(1, 9):
-                ws.cell(row=row, column=col).border = thin_border
-            row += 1
-
-    row += 1
-    ws.cell(row=row, column=1, value="Batch Total").font = header_font
-    ws.cell(row=row, column=2, value=total).font = header_font
-    row += 1
-    ws.cell(
-        row=row,
-        column=1,
-        value=f"Exported on {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
-    ).font = Font(italic=True)
-
-    # Column widths
-    from openpyxl.utils import get_column_letter
+            ws.append(
+                [
+                    styled(value, border=thin_border)
+                    for value in request_values + ["—", "—", "—"]
+                ]
+            )
 
-    for col in range(1, 9):
-        ws.column_dimensions[get_column_letter(col)].width = 18
+    ws.append([])
+    ws.append(
+        [
+            styled("Batch Total", font=header_font),
+            styled(total, font=header_font),
+        ]
+    )
+    ws.append(
+        [
+            styled(
+                f"Exported on {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
+                font=Font(italic=True),
+            )
+        ]
+    )
 
     buffer = io.BytesIO()
     wb.save(buffer)
-    buffer.seek(0)
 
     ts = datetime.utcnow().strftime("%Y%m%d_%H%M")
     filename = f"soa_export_{batch.title.replace(' ', '_')}_{ts}.xlsx"
-    return buffer.read(), filename
+    return buffer.getvalue(), filename
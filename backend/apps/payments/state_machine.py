@@ -26,6 +26,19 @@ PAYMENT_BATCH_TRANSITIONS = {
     "CANCELLED": [],  # Terminal
 }
 
+# Allowed targets per entity type and source state, as sets for the
+# validate_transition fast path (the lists above remain the source of truth)
+_ALLOWED_TARGETS = {
+    entity_type: {status: frozenset(targets) for status, targets in transitions.items()}
+    for entity_type, transitions in (
+        ("PaymentRequest", PAYMENT_REQUEST_TRANSITIONS),
+        ("PaymentBatch", PAYMENT_BATCH_TRANSITIONS),
+    )
+}
+
+# Batch statuses that accept no further changes to their requests
+CLOSED_BATCH_STATUSES = frozenset({"COMPLETED", "CANCELLED"})
+
 
 def validate_transition(entity_type, current_status, target_status):
     """
@@ -42,6 +55,12 @@ def validate_transition(entity_type, current_status, target_status):
     Raises:
         InvalidStateError: If transition is disallowed
     """
+    # Fast path: allowed transitions (including DRAFT -> DRAFT edits) are a
+    # single set lookup; anything else falls through to build the error.
+    allowed = _ALLOWED_TARGETS.get(entity_type, {}).get(current_status)
+    if allowed is not None and target_status in allowed:
+        return True
+
     if entity_type == "PaymentRequest":
         transitions = PAYMENT_REQUEST_TRANSITIONS
     elif entity_type == "PaymentBatch":
@@ -107,4 +126,4 @@ def is_terminal_state(entity_type, status):
 
 def is_closed_batch(status):
     """Check if batch status is COMPLETED or CANCELLED (closed)."""
-    return status in ("COMPLETED", "CANCELLED")
+    return status in CLOSED_BATCH_STATUSES
@@ -0,0 +1,116 @@
+"""
+Conditional single-UPDATE status transitions.
+"""
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.audit.models import AuditLog
+from apps.payments import services
+from apps.payments.models import PaymentBatch
+from apps.payments.versioning import atomic_transition
+from apps.users.models import User
+from core.exceptions import InvalidStateError, PermissionDeniedError
+
+
+class AtomicTransitionTests(TestCase):
+    """atomic_transition / cancel_batch without a prior SELECT FOR UPDATE."""
+
+    def setUp(self):
+        self.creator = User.objects.create_user(
+            username="transition_creator",
+            password="testpass123",
+            display_name="Transition Creator",
+            role="CREATOR",
+        )
+        self.other = User.objects.create_user(
+            username="transition_other",
+            password="testpass123",
+            display_name="Transition Other",
+            role="CREATOR",
+        )
+        self.admin = User.objects.create_user(
+            username="transition_admin",
+            password="testpass123",
+            display_name="Transition Admin",
+            role="ADMIN",
+        )
+        self.batch = PaymentBatch.objects.create(
+            title="Transition Batch", status="DRAFT", created_by=self.creator
+        )
+
+    def test_transition_requires_from_status_and_owner(self):
+        now = timezone.now()
+        fields = {"submitted_at": now, "completed_at": now}
+        self.assertEqual(
+            atomic_transition(
+                PaymentBatch,
+                self.batch.id,
+                "DRAFT",
+                "CANCELLED",
+                fields,
+                owner_field="created_by_id",
+                owner_id=self.other.id,
+            ),
+            0,
+        )
+        self.assertEqual(
+            atomic_transition(
+                PaymentBatch,
+                self.batch.id,
+                "DRAFT",
+                "CANCELLED",
+                fields,
+                owner_field="created_by_id",
+                owner_id=self.creator.id,
+            ),
+            1,
+        )
+        self.assertEqual(
+            atomic_transition(
+                PaymentBatch, self.batch.id, "DRAFT", "CANCELLED", fields
+            ),
+            0,
+        )
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.status, "CANCELLED")
+        self.assertEqual(self.batch.completed_at, now)
+
+    def test_cancel_batch_happy_path_queries(self):
+        # SAVEPOINT, UPDATE, SELECT, audit (actor, pk check, INSERT), RELEASE
+        with self.assertNumQueries(7):
+            batch = services.cancel_batch(self.batch.id, self.creator.id)
+        self.assertEqual(batch.status, "CANCELLED")
+        self.assertIsNotNone(batch.submitted_at)
+        self.assertTrue(
+            AuditLog.objects.filter(
+                event_type="BATCH_CANCELLED", entity_id=self.batch.id
+            ).exists()
+        )
+
+    def test_cancel_batch_admin_may_cancel_any_batch(self):
+        batch = services.cancel_batch(self.batch.id, self.admin.id)
+        self.assertEqual(batch.status, "CANCELLED")
+
+    def test_cancel_batch_non_owner_of_cancelled_batch_is_denied(self):
+        services.cancel_batch(self.batch.id, self.creator.id)
+        with self.assertRaises(PermissionDeniedError):
+            services.cancel_batch(self.batch.id, self.other.id)
+
+    def test_cancel_batch_repeat_is_idempotent(self):
+        services.cancel_batch(self.batch.id, self.creator.id)
+        batch = services.cancel_batch(self.batch.id, self.creator.id)
+        self.assertEqual(batch.status, "CANCELLED")
+        self.assertEqual(
+            AuditLog.objects.filter(
+                event_type="BATCH_CANCELLED", entity_id=self.batch.id
+            ).count(),
+            1,
+        )
+
+    def test_cancel_submitted_batch_raises_invalid_state(self):
+        PaymentBatch.objects.filter(id=self.batch.id).update(
+            status="SUBMITTED", submitted_at=timezone.now()
+        )
+        with self.assertRaises(InvalidStateError):
+            services.cancel_batch(self.batch.id, self.creator.id)
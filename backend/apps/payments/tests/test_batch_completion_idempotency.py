@@ -101,14 +101,15 @@ class BatchCompletionIdempotencyTests(APITestCase):
             getattr(approve_resp, "data", approve_resp.content),
         )
 
-        # First mark_paid (batch completes, SOA generated)
+        # First mark_paid (batch completes, SOA generated on commit)
         client.force_authenticate(user=admin)
-        resp1 = client.post(
-            f"/api/v1/requests/{request_id}/mark-paid",
-            {},
-            format="json",
-            HTTP_IDEMPOTENCY_KEY="bc-paid-key",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            resp1 = client.post(
+                f"/api/v1/requests/{request_id}/mark-paid",
+                {},
+                format="json",
+                HTTP_IDEMPOTENCY_KEY="bc-paid-key",
+            )
         self.assertEqual(resp1.status_code, 200, getattr(resp1, "data", resp1.content))
 
         # Replay mark_paid (same key — must not duplicate batch completion or SOA)
@@ -0,0 +1,175 @@
+"""
+Bulk write helpers on PaymentRequest.
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.payments import services
+from apps.payments.models import PaymentBatch, PaymentRequest, SOAVersion
+from apps.users.models import User
+
+
+class PaymentRequestBulkWriteTests(TestCase):
+    """bulk_create_for_batch / bulk_update_status write many rows at once."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="bulk_user",
+            password="testpass123",
+            display_name="Bulk User",
+            role="CREATOR",
+        )
+        self.batch = PaymentBatch.objects.create(
+            title="Bulk Batch", status="DRAFT", created_by=self.user
+        )
+
+    def _rows(self, n):
+        return [
+            {
+                "amount": Decimal("10.00"),
+                "currency": "USD",
+                "beneficiary_name": f"Ben {i}",
+                "beneficiary_account": f"ACC{i}",
+                "purpose": "Bulk",
+                "created_by": self.user,
+            }
+            for i in range(n)
+        ]
+
+    def test_bulk_create_for_batch(self):
+        with self.assertNumQueries(3):  # SAVEPOINT, INSERT, RELEASE
+            created = PaymentRequest.bulk_create_for_batch(self.batch, self._rows(5))
+        self.assertEqual(len(created), 5)
+        self.assertEqual(
+            PaymentRequest.objects.filter(batch=self.batch, status="DRAFT").count(), 5
+        )
+
+    def test_bulk_update_status_single_statement(self):
+        created = PaymentRequest.bulk_create_for_batch(self.batch, self._rows(3))
+        with self.assertNumQueries(1):
+            PaymentRequest.bulk_update_status(
+                created, "SUBMITTED", updated_by=self.user
+            )
+        self.assertEqual(
+            set(
+                PaymentRequest.objects.filter(batch=self.batch).values_list(
+                    "status", "updated_by_id"
+                )
+            ),
+            {("SUBMITTED", self.user.id)},
+        )
+
+
+class PaymentRequestClaimTests(TestCase):
+    """claim() returns unclaimed pending requests, oldest first."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="claim_user",
+            password="testpass123",
+            display_name="Claim User",
+            role="CREATOR",
+        )
+        batch = PaymentBatch.objects.create(
+            title="Claim Batch", status="DRAFT", created_by=self.user
+        )
+        self.requests = PaymentRequest.bulk_create_for_batch(
+            batch,
+            [
+                {
+                    "amount": Decimal("10.00"),
+                    "currency": "USD",
+                    "beneficiary_name": f"Ben {i}",
+                    "beneficiary_account": f"ACC{i}",
+                    "purpose": "Claim",
+                    "created_by": self.user,
+                    "status": "PENDING_APPROVAL",
+                }
+                for i in range(3)
+            ],
+        )
+
+    def test_claim_skips_claimed_and_respects_limit(self):
+        claimed = self.requests[0]
+        claimed.execution_id = uuid.uuid4()
+        claimed.save(update_fields=["execution_id"])
+
+        with transaction.atomic():
+            rows = list(PaymentRequest.objects.claim(limit=1))
+
+        self.assertEqual(len(rows), 1)
+        self.assertNotEqual(rows[0].id, claimed.id)
+        self.assertIsNone(rows[0].execution_id)
+
+
+class GenerateSoaBulkTests(TestCase):
+    """generate_soa_for_batch writes every request's SOA version in one go."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="soa_bulk_user",
+            password="testpass123",
+            display_name="SOA Bulk User",
+            role="CREATOR",
+        )
+        self.batch = PaymentBatch.objects.create(
+            title="SOA Bulk Batch", status="DRAFT", created_by=self.user
+        )
+        self.requests = PaymentRequest.bulk_create_for_batch(
+            self.batch,
+            [
+                {
+                    "amount": Decimal("10.00"),
+                    "currency": "USD",
+                    "beneficiary_name": f"Ben {i}",
+                    "beneficiary_account": f"ACC{i}",
+                    "purpose": "SOA",
+                    "created_by": self.user,
+                }
+                for i in range(3)
+            ],
+        )
+        SOAVersion.objects.create(
+            payment_request=self.requests[0],
+            version_number=1,
+            document_reference="soa/uploaded.pdf",
+            uploaded_by=self.user,
+        )
+        now = timezone.now()
+        PaymentBatch.objects.filter(id=self.batch.id).update(
+            status="COMPLETED", submitted_at=now, completed_at=now
+        )
+
+    @patch(
+        "apps.payments.soa_export.write_batch_soa_pdf",
+        return_value="batch_soa.pdf",
+    )
+    @patch(
+        "django.core.files.storage.default_storage.save",
+        return_value="soa/generated/batch_soa.pdf",
+    )
+    def test_next_versions_and_query_count(self, _save, _export):
+        # SAVEPOINT, batch lock, generated check, max versions, request ids,
+        # INSERT, audit (pk check, INSERT), RELEASE
+        with self.assertNumQueries(9):
+            created = services.generate_soa_for_batch(self.batch.id)
+        self.assertEqual(len(created), 3)
+        versions = dict(
+            SOAVersion.objects.filter(source=SOAVersion.SOURCE_GENERATED).values_list(
+                "payment_request_id", "version_number"
+            )
+        )
+        self.assertEqual(
+            versions,
+            {
+                self.requests[0].id: 2,
+                self.requests[1].id: 1,
+                self.requests[2].id: 1,
+            },
+        )
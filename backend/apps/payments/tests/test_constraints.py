@@ -5,7 +5,7 @@ Force IntegrityError and confirm expected behavior.
 
 from decimal import Decimal
 
-from django.db import IntegrityError, transaction
+from django.db import DataError, IntegrityError, connection, transaction
 from django.test import TestCase
 from django.utils import timezone
 
@@ -191,3 +191,71 @@ class UniqueRequestVersionConstraintTests(TestCase):
                     source="UPLOAD",
                     uploaded_at=timezone.now(),
                 )
+
+
+class StatusEnumTypeTests(TestCase):
+    """Status/decision columns are PostgreSQL ENUMs; unknown values are rejected."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="enum_user",
+            password="testpass123",
+            display_name="Enum User",
+            role="CREATOR",
+        )
+
+    def test_unknown_batch_status_rejected(self):
+        with self.assertRaises(DataError):
+            with transaction.atomic():
+                PaymentBatch.objects.create(
+                    title="Enum Batch", status="BOGUS", created_by=self.user
+                )
+
+    def test_status_reads_back_as_string(self):
+        batch = PaymentBatch.objects.create(
+            title="Enum Batch", status="DRAFT", created_by=self.user
+        )
+        status = PaymentBatch.objects.values_list("status", flat=True).get(id=batch.id)
+        self.assertEqual(status, "DRAFT")
+        self.assertIsInstance(status, str)
+
+    def test_status_sorts_in_lifecycle_order(self):
+        """ORDER BY status follows the ENUM declaration, not the alphabet."""
+        now = timezone.now()
+        cancelled = PaymentBatch.objects.create(
+            title="Cancelled",
+            status="CANCELLED",
+            created_by=self.user,
+            submitted_at=now,
+            completed_at=now,
+        )
+        draft = PaymentBatch.objects.create(
+            title="Draft", status="DRAFT", created_by=self.user
+        )
+        self.assertEqual(
+            list(PaymentBatch.objects.order_by("status")), [draft, cancelled]
+        )
+
+    def test_enum_declaration_order(self):
+        expected = {
+            "payment_batch_status": [
+                "DRAFT",
+                "SUBMITTED",
+                "PROCESSING",
+                "COMPLETED",
+                "CANCELLED",
+            ],
+            "payment_request_status": [
+                "DRAFT",
+                "SUBMITTED",
+                "PENDING_APPROVAL",
+                "APPROVED",
+                "REJECTED",
+                "PAID",
+            ],
+            "approval_decision": ["APPROVED", "REJECTED"],
+        }
+        with connection.cursor() as cursor:
+            for enum_name, labels in expected.items():
+                cursor.execute(f"SELECT unnest(enum_range(NULL::{enum_name}))")
+                self.assertEqual([row[0] for row in cursor.fetchall()], labels)
@@ -0,0 +1,37 @@
+"""
+Idempotency key retention: expired keys are purged, live keys are kept.
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.payments.models import IDEMPOTENCY_KEY_TTL, IdempotencyKey
+
+
+class IdempotencyKeyPurgeTests(TestCase):
+    """purge_idempotency_keys deletes only keys past expires_at."""
+
+    def test_new_key_gets_default_expiry(self):
+        before = timezone.now()
+        key = IdempotencyKey.objects.create(key="ttl-key", operation="OP")
+        self.assertGreaterEqual(key.expires_at, before + IDEMPOTENCY_KEY_TTL)
+
+    def test_purge_removes_only_expired_keys(self):
+        IdempotencyKey.objects.create(
+            key="expired-key",
+            operation="OP",
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+        IdempotencyKey.objects.create(key="live-key", operation="OP")
+
+        out = StringIO()
+        call_command("purge_idempotency_keys", stdout=out)
+
+        self.assertIn("Purged 1", out.getvalue())
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list("key", flat=True)), ["live-key"]
+        )
@@ -55,6 +55,23 @@ class IdempotencyApproveReplayTests(TestCase):
         services.submit_batch(self.batch.id, self.creator.id)
         self.req.refresh_from_db()
 
+    def test_service_replay_returns_recorded_request(self):
+        first = services.approve_request(
+            self.req.id, self.approver.id, idempotency_key="svc-replay"
+        )
+        replay_flag = []
+        # Savepoints around the failed key INSERT, then a single lookup query
+        with self.assertNumQueries(7):
+            replayed = services.approve_request(
+                self.req.id,
+                self.approver.id,
+                idempotency_key="svc-replay",
+                _idempotency_replay=replay_flag,
+            )
+        self.assertEqual(replay_flag, [True])
+        self.assertEqual(replayed.id, first.id)
+        self.assertEqual(replayed.status, "APPROVED")
+
     def test_approve_replay_returns_200_and_no_duplicate_side_effects(self):
         url = f"/api/v1/requests/{self.req.id}/approve"
         payload = {"comment": "Approve"}
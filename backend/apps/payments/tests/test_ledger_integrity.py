@@ -16,6 +16,7 @@ from apps.ledger.models import (
     SubcontractorScope,
     Subcontractor,
 )
+from apps.audit.models import AuditLog
 from apps.payments.models import PaymentBatch
 from apps.payments import services
 from apps.users.models import User
@@ -129,3 +130,47 @@ class LedgerIntegrityTests(TestCase):
         self.assertEqual(req.site_snapshot_code, self.site_active.code)
         self.assertIsNotNone(req.total_amount)
         self.assertEqual(req.total_amount, Decimal("60"))
+
+    def test_assigned_site_passed_as_string_is_not_an_override(self):
+        sub = Subcontractor.objects.create(
+            name="Sub Assigned",
+            scope=self.scope,
+            is_active=True,
+            assigned_site=self.site_active,
+        )
+        services.add_request(
+            self.batch.id,
+            self.creator.id,
+            entity_type="SUBCONTRACTOR",
+            subcontractor_id=sub.id,
+            site_id=str(self.site_active.id),
+            base_amount=Decimal("100"),
+            currency="USD",
+        )
+        self.assertFalse(
+            AuditLog.objects.filter(event_type="SUBCONTRACTOR_SITE_OVERRIDE").exists()
+        )
+
+    def test_site_override_is_audited_against_created_request(self):
+        other_site = Site.objects.create(
+            code="SITE-C", name="Site C", client=self.client_obj, is_active=True
+        )
+        sub = Subcontractor.objects.create(
+            name="Sub Assigned",
+            scope=self.scope,
+            is_active=True,
+            assigned_site=self.site_active,
+        )
+        request = services.add_request(
+            self.batch.id,
+            self.creator.id,
+            entity_type="SUBCONTRACTOR",
+            subcontractor_id=sub.id,
+            site_id=other_site.id,
+            base_amount=Decimal("100"),
+            currency="USD",
+        )
+        override = AuditLog.objects.get(event_type="SUBCONTRACTOR_SITE_OVERRIDE")
+        self.assertEqual(override.entity_id, request.id)
+        self.assertEqual(override.previous_state["assigned_site_code"], "SITE-A")
+        self.assertEqual(override.new_state["selected_site_code"], "SITE-C")
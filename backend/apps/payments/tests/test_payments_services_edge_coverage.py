@@ -23,6 +23,7 @@ from core.exceptions import (
 from apps.audit.models import AuditLog
 from apps.payments.models import (
     ApprovalRecord,
+    IdempotencyKey,
     PaymentBatch,
     PaymentRequest,
     SOAVersion,
@@ -91,6 +92,27 @@ class VersionLockConflictTests(TestCase):
                 )
             self.assertIn("Concurrent modification", str(ctx.exception.message))
 
+    def test_approve_returns_request_matching_database_row(self):
+        """Returned instance carries the post-update status/version/updated_by."""
+        returned = services.approve_request(self.req.id, self.approver.id)
+        stored = PaymentRequest.objects.get(id=self.req.id)
+        self.assertEqual(
+            (returned.status, returned.version, returned.updated_by_id),
+            (stored.status, stored.version, stored.updated_by_id),
+        )
+        self.assertEqual(returned.version, self.req.version + 1)
+
+    def test_mark_paid_returns_request_matching_database_row(self):
+        """mark_paid records the actor by id without loading the User."""
+        services.approve_request(self.req.id, self.approver.id)
+        returned = services.mark_paid(self.req.id, self.admin.id)
+        stored = PaymentRequest.objects.get(id=self.req.id)
+        self.assertEqual(
+            (returned.status, returned.version, returned.updated_by_id),
+            (stored.status, stored.version, stored.updated_by_id),
+        )
+        self.assertEqual(stored.updated_by_id, self.admin.id)
+
     def test_reject_version_lock_conflict_raises_invalid_state(self):
         """version_locked_update returns 0 → reject_request raises InvalidStateError."""
         with patch(
@@ -203,15 +225,21 @@ class BatchCompletionLogicTests(TestCase):
         )
         self.req1.refresh_from_db()
         self.req2.refresh_from_db()
-        services.mark_paid(self.req1.id, self.admin.id, idempotency_key="bc-mp-first")
-        services.mark_paid(self.req2.id, self.admin.id, idempotency_key="bc-mp-second")
-        self.batch.refresh_from_db()
-        self.assertEqual(self.batch.status, "COMPLETED")
-        self.assertIsNotNone(self.batch.completed_at)
         generated = SOAVersion.objects.filter(
             payment_request__batch=self.batch,
             source=SOAVersion.SOURCE_GENERATED,
         )
+        # SOA generation is deferred until mark_paid's transaction commits
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            services.mark_paid(
+                self.req1.id, self.admin.id, idempotency_key="bc-mp-first"
+            )
+            self.assertFalse(generated.exists())
+        self.assertEqual(len(callbacks), 1)
+        services.mark_paid(self.req2.id, self.admin.id, idempotency_key="bc-mp-second")
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.status, "COMPLETED")
+        self.assertIsNotNone(self.batch.completed_at)
         self.assertEqual(generated.count(), 2)
 
     def test_generate_soa_for_batch_already_generated_returns_empty(self):
@@ -222,7 +250,10 @@ class BatchCompletionLogicTests(TestCase):
         services.approve_request(
             self.req2.id, self.approver.id, idempotency_key="bc-sga-2"
         )
-        services.mark_paid(self.req1.id, self.admin.id, idempotency_key="bc-sga-mp1")
+        with self.captureOnCommitCallbacks(execute=True):
+            services.mark_paid(
+                self.req1.id, self.admin.id, idempotency_key="bc-sga-mp1"
+            )
         services.mark_paid(self.req2.id, self.admin.id, idempotency_key="bc-sga-mp2")
         # generate_soa_for_batch already run by mark_paid; second call idempotent
         second = services.generate_soa_for_batch(self.batch.id)
@@ -583,6 +614,27 @@ class PermissionViolationServiceTests(TestCase):
                 idempotency_key="perm-add-req",
             )
 
+    def test_admin_may_add_request_and_submit_other_users_batch(self):
+        """ADMIN bypasses the batch-creator check in add_request/submit_batch."""
+        admin = User.objects.create_user(
+            username="perm_admin",
+            password="testpass123",
+            display_name="Perm Admin",
+            role="ADMIN",
+        )
+        req = services.add_request(
+            self.batch.id,
+            admin.id,
+            amount=Decimal("50"),
+            currency="USD",
+            beneficiary_name="X",
+            beneficiary_account="A",
+            purpose="P",
+        )
+        self.assertEqual(req.created_by_id, admin.id)
+        batch = services.submit_batch(self.batch.id, admin.id)
+        self.assertEqual(batch.status, "PROCESSING")
+
     def test_approve_request_creator_raises_permission_denied(self):
         """Only APPROVER/ADMIN can approve (creator cannot)."""
         services.submit_batch(self.batch.id, self.creator.id)
@@ -726,6 +778,21 @@ class ServiceConflictAndValidationTests(TestCase):
                 idempotency_key="add-neg",
             )
 
+    def test_add_request_invalid_input_rejected_without_queries(self):
+        """add_request validates its input before opening the transaction."""
+        with self.assertNumQueries(0):
+            with self.assertRaises(ValidationError):
+                services.add_request(
+                    self.batch.id,
+                    self.creator.id,
+                    currency="USD",
+                    entity_type="VENDOR",
+                    site_id=self.batch.id,
+                    base_amount=Decimal("10"),
+                    idempotency_key="add-no-vendor",
+                )
+        self.assertFalse(IdempotencyKey.objects.filter(key="add-no-vendor").exists())
+
     def test_update_request_not_found_raises_not_found(self):
         """update_request with non-existent request_id → NotFoundError."""
         import uuid
@@ -1423,6 +1490,24 @@ class UploadSoaMissingBranchesTests(TestCase):
         self.assertEqual(soa.payment_request_id, self.req.id)
         self.assertEqual(soa.version_number, 1)
         self.assertEqual(soa.source, SOAVersion.SOURCE_UPLOAD)
+
+    def test_upload_soa_second_upload_increments_version(self):
+        """upload_soa twice → second SOAVersion gets version_number 2."""
+        from django.core.files.base import ContentFile
+
+        services.upload_soa(
+            self.batch.id,
+            self.req.id,
+            self.creator.id,
+            ContentFile(b"first", name="first.pdf"),
+        )
+        soa = services.upload_soa(
+            self.batch.id,
+            self.req.id,
+            self.creator.id,
+            ContentFile(b"second", name="second.pdf"),
+        )
+        self.assertEqual(soa.version_number, 2)
         self.assertEqual(
             AuditLog.objects.filter(
                 entity_id=soa.id, event_type="SOA_UPLOADED"
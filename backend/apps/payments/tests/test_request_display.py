@@ -0,0 +1,151 @@
+"""
+PaymentRequest read helpers: SQL-side display values, lean list loading and
+precomputed counts.
+"""
+
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.test import TestCase
+from rest_framework import serializers
+
+from apps.payments.models import PaymentBatch, PaymentCounts, PaymentRequest
+from apps.payments.serializers import PaymentRequestListSerializer
+from apps.users.models import User
+
+
+class PaymentRequestDisplayTests(TestCase):
+    """with_display() matches the Python fallback used by __str__."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="display_user",
+            password="testpass123",
+            display_name="Display User",
+            role="CREATOR",
+        )
+        self.batch = PaymentBatch.objects.create(
+            title="Display Batch", status="DRAFT", created_by=self.user
+        )
+        self.req = PaymentRequest.objects.create(
+            batch=self.batch,
+            status="DRAFT",
+            currency="USD",
+            created_by=self.user,
+            beneficiary_name="Ben",
+            beneficiary_account="ACC",
+            purpose="P",
+            amount=Decimal("100.00"),
+        )
+
+    def test_with_display_annotates_name_and_amount(self):
+        req = PaymentRequest.objects.with_display().get(id=self.req.id)
+        self.assertEqual(req.display_name, "Ben")
+        self.assertEqual(req.display_amount, Decimal("100.00"))
+
+    def test_str_same_with_and_without_annotation(self):
+        annotated = PaymentRequest.objects.with_display().get(id=self.req.id)
+        plain = PaymentRequest.objects.get(id=self.req.id)
+        self.assertEqual(str(annotated), str(plain))
+        self.assertEqual(str(plain), "Ben - 100.00 USD (DRAFT)")
+
+    def test_dicts_for_list_serializes_in_one_query(self):
+        qs = PaymentRequest.objects.dicts_for_list()
+        with self.assertNumQueries(1):
+            data = PaymentRequestListSerializer(list(qs), many=True).data
+        self.assertEqual(data[0]["id"], str(self.req.id))
+        self.assertEqual(data[0]["totalAmount"], "100.00")
+        self.assertEqual(data[0]["amount"], "100.00")
+        self.assertEqual(data[0]["batchTitle"], "Display Batch")
+        self.assertEqual(data[0]["purpose"], "P")
+        self.assertIsNone(data[0]["entityName"])
+
+    def test_dict_fast_path_matches_generic_representation(self):
+        row = PaymentRequest.objects.dicts_for_list().get(id=self.req.id)
+        serializer = PaymentRequestListSerializer()
+        generic = serializers.Serializer.to_representation(serializer, row)
+        self.assertEqual(serializer.to_representation(row), generic)
+
+    def test_dicts_for_list_computes_ledger_display_values(self):
+        ledger = PaymentRequest.objects.create(
+            batch=self.batch,
+            status="DRAFT",
+            currency="USD",
+            created_by=self.user,
+            entity_type="VENDOR",
+            vendor_snapshot_name="Acme",
+            base_amount=Decimal("80.00"),
+            extra_amount=Decimal("5.50"),
+            total_amount=Decimal("85.50"),
+        )
+        row = PaymentRequest.objects.filter(id=ledger.id).dicts_for_list().get()
+        data = PaymentRequestListSerializer(row).data
+        self.assertEqual(data["entityName"], "Acme")
+        self.assertEqual(data["totalAmount"], "85.50")
+        self.assertIsNone(data["amount"])
+
+    def test_unannotated_instance_matches_list_row(self):
+        ledger = PaymentRequest.objects.create(
+            batch=self.batch,
+            status="DRAFT",
+            currency="USD",
+            created_by=self.user,
+            entity_type="VENDOR",
+            vendor_snapshot_name="Acme",
+            base_amount=Decimal("80.00"),
+            extra_amount=Decimal("5.50"),
+            total_amount=Decimal("85.50"),
+        )
+        for req_id in (self.req.id, ledger.id):
+            plain = PaymentRequest.objects.select_related("batch").get(id=req_id)
+            row = PaymentRequest.objects.dicts_for_list().get(id=req_id)
+            with self.assertNumQueries(0):
+                data = PaymentRequestListSerializer(plain).data
+            self.assertEqual(data, PaymentRequestListSerializer(row).data)
+
+
+class PaymentCountsViewTests(TestCase):
+    """PaymentCounts reads mv_payment_counts after a refresh."""
+
+    def test_refresh_picks_up_new_requests(self):
+        user = User.objects.create_user(
+            username="counts_user",
+            password="testpass123",
+            display_name="Counts User",
+            role="CREATOR",
+        )
+        batch = PaymentBatch.objects.create(
+            title="Counts Batch", status="DRAFT", created_by=user
+        )
+        for i in range(2):
+            PaymentRequest.objects.create(
+                batch=batch,
+                status="PENDING_APPROVAL",
+                currency="USD",
+                created_by=user,
+                beneficiary_name=f"Ben {i}",
+                beneficiary_account="ACC",
+                purpose="P",
+                amount=Decimal("1.00"),
+            )
+
+        call_command("refresh_payment_counts", stdout=StringIO())
+
+        self.assertEqual(PaymentCounts.total_for_status("PENDING_APPROVAL"), 2)
+        row = PaymentCounts.objects.get(batch=batch, status="PENDING_APPROVAL")
+        self.assertEqual(row.n, 2)
+
+    def test_migration_state_matches_model(self):
+        """Migrations declare the batch FK, so later migrations can use it."""
+        state = MigrationLoader(connection).project_state()
+        counts = state.apps.get_model("payments", "PaymentCounts")
+        batch_field = counts._meta.get_field("batch")
+        self.assertEqual(batch_field.related_model._meta.model_name, "paymentbatch")
+        self.assertFalse(batch_field.db_constraint)
+        self.assertEqual(
+            [f.name for f in counts._meta.get_fields()],
+            [f.name for f in PaymentCounts._meta.get_fields()],
+        )
@@ -0,0 +1,293 @@
+"""
+Serializer read paths: computed fields come from the database, not per-row
+Python loops or per-object queries.
+"""
+
+from decimal import Decimal
+
+from django.db.models import Count
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.payments.models import (
+    ApprovalRecord,
+    PaymentBatch,
+    PaymentRequest,
+    SOAVersion,
+)
+from apps.payments.serializers import (
+    PaymentBatchDetailSerializer,
+    PaymentBatchSerializer,
+    PaymentRequestDetailSerializer,
+)
+from apps.users.models import User
+
+
+class SerializerQueryTestBase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="serializer_user",
+            password="testpass123",
+            display_name="Serializer User",
+            role="CREATOR",
+        )
+        self.batch = PaymentBatch.objects.create(
+            title="Serializer Batch", status="DRAFT", created_by=self.user
+        )
+        for amount in ("100.00", "50.25"):
+            PaymentRequest.objects.create(
+                batch=self.batch,
+                status="DRAFT",
+                currency="USD",
+                created_by=self.user,
+                beneficiary_name="Ben",
+                beneficiary_account="ACC",
+                purpose="P",
+                amount=Decimal(amount),
+            )
+
+
+class BatchTotalTests(SerializerQueryTestBase):
+    def _detail(self, batch_id):
+        batch = PaymentBatchDetailSerializer.setup_eager_loading(
+            PaymentBatch.objects
+        ).get(id=batch_id)
+        return PaymentBatchDetailSerializer(batch).data
+
+    def test_batch_total_is_annotated_sum(self):
+        self.assertEqual(self._detail(self.batch.id)["batchTotal"], "150.25")
+
+    def test_empty_batch_total_is_zero(self):
+        empty = PaymentBatch.objects.create(
+            title="Empty", status="DRAFT", created_by=self.user
+        )
+        data = self._detail(empty.id)
+        self.assertEqual(data["batchTotal"], "0")
+        self.assertEqual(data["requestCount"], 0)
+
+    def test_batch_total_without_annotation(self):
+        empty = PaymentBatch.objects.create(
+            title="Empty", status="DRAFT", created_by=self.user
+        )
+        serializer = PaymentBatchDetailSerializer()
+        with self.assertNumQueries(1):
+            total = serializer.get_batchTotal(self.batch)
+        self.assertEqual(total, "150.25")
+        self.assertEqual(serializer.get_batchTotal(empty), "0")
+
+    def test_detail_endpoint_batch_total(self):
+        empty = PaymentBatch.objects.create(
+            title="Empty", status="DRAFT", created_by=self.user
+        )
+        client = APIClient()
+        client.force_authenticate(self.user)
+        for batch, expected in ((self.batch, "150.25"), (empty, "0")):
+            response = client.get(f"/api/v1/batches/{batch.id}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["data"]["batchTotal"], expected)
+
+
+class BatchDetailTests(SerializerQueryTestBase):
+    def test_batch_detail_embeds_lean_request_rows(self):
+        batch = PaymentBatchDetailSerializer.setup_eager_loading(
+            PaymentBatch.objects
+        ).get(id=self.batch.id)
+        with self.assertNumQueries(0):
+            data = PaymentBatchDetailSerializer(batch).data
+        self.assertEqual(data["requestCount"], 2)
+        row = data["requests"][0]
+        self.assertEqual(row["batchTitle"], "Serializer Batch")
+        self.assertIn(row["totalAmount"], ("100.00", "50.25"))
+        self.assertNotIn("beneficiaryAccount", row)
+
+    def test_submit_response_includes_full_request_rows(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post(
+            f"/api/v1/batches/{self.batch.id}/submit",
+            HTTP_IDEMPOTENCY_KEY="serializer-submit",
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        rows = response.json()["data"]["requests"]
+        self.assertEqual(len(rows), 2)
+        for row in rows:
+            self.assertEqual(row["batchTitle"], "Serializer Batch")
+            self.assertEqual(row["status"], "PENDING_APPROVAL")
+            self.assertIn(row["totalAmount"], ("100.00", "50.25"))
+
+
+class RequestCountTests(SerializerQueryTestBase):
+    def test_annotated_batch_list_counts_in_one_query(self):
+        PaymentBatch.objects.create(title="Other", status="DRAFT", created_by=self.user)
+        with self.assertNumQueries(1):
+            data = PaymentBatchSerializer(
+                PaymentBatch.objects.annotate(request_count=Count("requests")),
+                many=True,
+            ).data
+        counts = {row["title"]: row["requestCount"] for row in data}
+        self.assertEqual(counts, {"Serializer Batch": 2, "Other": 0})
+
+    def test_unannotated_batch_falls_back_to_count(self):
+        self.assertEqual(PaymentBatchSerializer(self.batch).data["requestCount"], 2)
+
+
+class RequestDetailEagerLoadingTests(SerializerQueryTestBase):
+    def setUp(self):
+        super().setUp()
+        for req in PaymentRequest.objects.all():
+            for version in (2, 1):
+                SOAVersion.objects.create(
+                    payment_request=req,
+                    version_number=version,
+                    document_reference=f"ref{version}",
+                    uploaded_by=self.user,
+                )
+
+    def test_eager_loaded_detail_list_has_fixed_query_count(self):
+        qs = PaymentRequestDetailSerializer.setup_eager_loading(PaymentRequest.objects)
+        # requests (+ approval join), SOA versions (+ uploader join)
+        with self.assertNumQueries(2):
+            data = PaymentRequestDetailSerializer(qs, many=True).data
+        for row in data:
+            self.assertIsNone(row["approval"])
+            self.assertEqual(
+                [soa["versionNumber"] for soa in row["soaVersions"]], [1, 2]
+            )
+            self.assertEqual(row["soaVersions"][0]["uploadedByName"], "Serializer User")
+            self.assertEqual(
+                row["soaVersions"][0]["downloadUrl"],
+                f"/api/v1/batches/{self.batch.id}/requests/{row['id']}/soa/"
+                f"{row['soaVersions'][0]['id']}/download",
+            )
+            initial, replacement = (soa["changeSummary"] for soa in row["soaVersions"])
+            self.assertTrue(initial.startswith("Initial upload by Serializer User on "))
+            self.assertTrue(
+                replacement.startswith(
+                    "Version 2 - Replaces v1, uploaded by Serializer User on "
+                )
+            )
+
+    def test_approval_is_nested(self):
+        req = PaymentRequest.objects.first()
+        ApprovalRecord.objects.create(
+            payment_request=req, approver=self.user, decision="APPROVED"
+        )
+        qs = PaymentRequestDetailSerializer.setup_eager_loading(PaymentRequest.objects)
+        approval = PaymentRequestDetailSerializer(qs.get(id=req.id)).data["approval"]
+        self.assertEqual(approval["decision"], "APPROVED")
+        self.assertIsNone(approval["comment"])
+        self.assertEqual(approval["approverId"], str(self.user.id))
+        self.assertIsNotNone(approval["createdAt"])
+
+    def test_unprefetched_detail_still_orders_versions(self):
+        req = PaymentRequest.objects.first()
+        data = PaymentRequestDetailSerializer(req).data
+        self.assertEqual([soa["versionNumber"] for soa in data["soaVersions"]], [1, 2])
+
+    def test_change_summary_timestamp_matches_python_formatting(self):
+        req = PaymentRequest.objects.first()
+        first = req.soa_versions.get(version_number=1)
+        expected = first.uploaded_at.strftime("%Y-%m-%d %H:%M")
+        for loaded in (
+            req,
+            PaymentRequestDetailSerializer.setup_eager_loading(
+                PaymentRequest.objects
+            ).get(id=req.id),
+        ):
+            summary = PaymentRequestDetailSerializer(loaded).data["soaVersions"][0]
+            self.assertTrue(summary["changeSummary"].endswith(f" on {expected}"))
+
+
+class LiveSoaSummaryTests(SerializerQueryTestBase):
+    def setUp(self):
+        super().setUp()
+        req = PaymentRequest.objects.first()
+        for version in (1, 3, 2):
+            SOAVersion.objects.create(
+                payment_request=req,
+                version_number=version,
+                document_reference=f"ref{version}",
+            )
+        self.req_with_soa = req
+
+    def test_summary_uses_prefetched_soa_versions(self):
+        batch = PaymentBatch.objects.prefetch_related(
+            "requests", "requests__soa_versions"
+        ).get(id=self.batch.id)
+        with self.assertNumQueries(0):
+            summary = PaymentBatchDetailSerializer().get_liveSoaSummary(batch)
+        by_id = {row["requestId"]: row for row in summary}
+        self.assertEqual(by_id[self.req_with_soa.id]["latestVersion"], 3)
+        self.assertEqual(len(summary), 2)
+        self.assertEqual([row["hasSoa"] for row in summary].count(False), 1)
+
+    def test_summary_without_prefetch_queries_once_per_relation(self):
+        with self.assertNumQueries(2):
+            summary = PaymentBatchDetailSerializer().get_liveSoaSummary(self.batch)
+        latest = {row["requestId"]: row["latestVersion"] for row in summary}
+        self.assertEqual(latest[self.req_with_soa.id], 3)
+
+
+class CachedFieldsTests(TestCase):
+    def test_fields_are_cached_per_class_and_copied_per_instance(self):
+        first = PaymentBatchDetailSerializer(context={"marker": 1})
+        second = PaymentBatchDetailSerializer(context={"marker": 2})
+        self.assertIsNot(first.fields["title"], second.fields["title"])
+        self.assertIn("_cached_fields", PaymentBatchDetailSerializer.__dict__)
+        self.assertIs(first.fields["title"].parent, first)
+        self.assertIs(second.fields["title"].parent, second)
+        # Nested serializers resolve context through their own parent
+        self.assertEqual(first.fields["requests"].child.context["marker"], 1)
+        self.assertEqual(second.fields["requests"].child.context["marker"], 2)
+
+    def test_instance_changes_do_not_leak_into_later_instances(self):
+        first = PaymentBatchDetailSerializer()
+        title = first.fields["title"]
+        title.validators.append(lambda value: None)
+        title.error_messages["blank"] = "Changed"
+        title._kwargs["max_length"] = 1
+
+        second = PaymentBatchDetailSerializer().fields["title"]
+        self.assertEqual(len(second.validators), len(title.validators) - 1)
+        self.assertNotEqual(second.error_messages["blank"], "Changed")
+        self.assertNotEqual(second._kwargs.get("max_length"), 1)
+
+    def test_subclass_does_not_reuse_parent_cache(self):
+        PaymentBatchSerializer().fields
+        self.assertNotIn("batchTotal", PaymentBatchSerializer().fields)
+        self.assertIn("batchTotal", PaymentBatchDetailSerializer().fields)
+
+
+class ApprovalQueueQueryTests(SerializerQueryTestBase):
+    def _list_queries(self, client):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/v1/requests?status=DRAFT")
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.data["results"]
+
+    def test_query_count_does_not_grow_with_rows(self):
+        approver = User.objects.create_user(
+            username="queue_approver",
+            password="testpass123",
+            display_name="Queue Approver",
+            role="APPROVER",
+        )
+        client = APIClient()
+        client.force_authenticate(approver)
+        before, rows = self._list_queries(client)
+        self.assertEqual(rows[0]["batchTitle"], "Serializer Batch")
+        for _ in range(3):
+            PaymentRequest.objects.create(
+                batch=self.batch,
+                status="DRAFT",
+                currency="USD",
+                created_by=self.user,
+                beneficiary_name="Ben",
+                beneficiary_account="ACC",
+                amount=Decimal("1.00"),
+            )
+        after, rows = self._list_queries(client)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(before, after)
@@ -5,12 +5,17 @@ GET /api/v1/batches/{batch_id}/soa-export?export=pdf|excel. Real DB.
 Covers soa_export.py; view in test_payments_views_coverage.py.
 """
 
+import io
 from decimal import Decimal
 
 from django.test import TestCase
 
 from apps.payments.models import PaymentBatch, PaymentRequest, SOAVersion
-from apps.payments.soa_export import export_batch_soa_pdf, export_batch_soa_excel
+from apps.payments.soa_export import (
+    export_batch_soa_excel,
+    export_batch_soa_pdf,
+    write_batch_soa_pdf,
+)
 from apps.users.models import User
 
 
@@ -130,9 +135,22 @@ class SOAExportCoverageTests(TestCase):
             source="UPLOAD",
             uploaded_by=self.user,
         )
-        content, filename = export_batch_soa_pdf(batch.id)
+        # Batch with its total, requests, SOA versions with uploaders
+        with self.assertNumQueries(3):
+            content, filename = export_batch_soa_pdf(batch.id)
         self._assert_pdf(content, filename, batch.title)
 
+    def test_write_batch_soa_pdf_renders_into_given_file(self):
+        """write_batch_soa_pdf → PDF written to the caller's file object."""
+        batch = PaymentBatch.objects.create(
+            title="WriteInto",
+            status="DRAFT",
+            created_by=self.user,
+        )
+        out = io.BytesIO()
+        filename = write_batch_soa_pdf(batch.id, out)
+        self._assert_pdf(out.getvalue(), filename, batch.title)
+
     # --- Phase B: Excel ---
 
     def test_soa_export_excel_empty_batch(self):
@@ -226,5 +244,52 @@ class SOAExportCoverageTests(TestCase):
             source="UPLOAD",
             uploaded_by=None,
         )
-        content, filename = export_batch_soa_excel(batch.id)
+        with self.assertNumQueries(3):
+            content, filename = export_batch_soa_excel(batch.id)
         self._assert_excel(content, filename)
+
+    def test_soa_export_excel_layout(self):
+        """Excel rows: batch info, header, one row per SOA, blank, total."""
+        from openpyxl import load_workbook
+
+        batch = PaymentBatch.objects.create(
+            title="ExcelLayout",
+            status="DRAFT",
+            created_by=self.user,
+        )
+        req = PaymentRequest.objects.create(
+            batch=batch,
+            status="DRAFT",
+            currency="USD",
+            created_by=self.user,
+            beneficiary_name="G",
+            beneficiary_account="G1",
+            purpose="P",
+            amount=Decimal("40.00"),
+        )
+        for version in (1, 2):
+            SOAVersion.objects.create(
+                payment_request=req,
+                version_number=version,
+                document_reference=f"d{version}",
+                source="UPLOAD",
+                uploaded_by=self.user if version == 1 else None,
+            )
+        content, _ = export_batch_soa_excel(batch.id)
+
+        ws = load_workbook(io.BytesIO(content)).active
+        self.assertEqual(ws.title, "SOA Export")
+        rows = [row for row in ws.iter_rows(min_row=1, max_col=8, values_only=True)]
+        self.assertEqual(rows[0][0], "Batch Information")
+        self.assertEqual(rows[2][:2], ("Title", "ExcelLayout"))
+        self.assertEqual(rows[6][0], "Payment Requests & SOA")
+        self.assertEqual(rows[7][0], "Beneficiary")
+        self.assertTrue(ws.cell(row=8, column=1).font.bold)
+        self.assertEqual(rows[8][:6], ("G", 40.0, "USD", "P", "DRAFT", 1))
+        self.assertEqual(rows[8][7], "SOA Export User")
+        self.assertEqual(rows[9][5], 2)
+        self.assertEqual(rows[9][7], "System")
+        self.assertEqual(ws.cell(row=10, column=8).border.left.style, "thin")
+        self.assertEqual(rows[11][:2], ("Batch Total", 40.0))
+        self.assertTrue(rows[12][0].startswith("Exported on"))
+        self.assertEqual(ws.column_dimensions["H"].width, 18)
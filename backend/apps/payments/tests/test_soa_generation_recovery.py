@@ -0,0 +1,178 @@
+"""
+Batch completion SOA generation failures and recovery.
+
+mark_paid generates the SOA after its transaction commits; a failure there
+must not turn a committed payment into an error response, and
+generate_missing_soas must backfill the missing SOA. Generation is
+idempotent however often the two callers run it.
+"""
+
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from rest_framework.test import APIClient, APITestCase
+
+from apps.payments import services, soa_export
+from apps.payments.management.commands import generate_missing_soas
+from apps.payments.models import PaymentBatch, PaymentRequest, SOAVersion
+from apps.users.models import User
+
+
+class SOAGenerationRecoveryTests(APITestCase):
+    """Post-commit SOA generation failure is logged and recoverable."""
+
+    def setUp(self):
+        self.creator = User.objects.create_user(
+            username="soa_rec_creator",
+            password="pass",
+            display_name="SOA Rec Creator",
+            role="CREATOR",
+        )
+        self.approver = User.objects.create_user(
+            username="soa_rec_approver",
+            password="pass",
+            display_name="SOA Rec Approver",
+            role="APPROVER",
+        )
+        self.admin = User.objects.create_user(
+            username="soa_rec_admin",
+            password="pass",
+            display_name="SOA Rec Admin",
+            role="ADMIN",
+        )
+        self.batch = PaymentBatch.objects.create(
+            title="SOA Recovery", status="DRAFT", created_by=self.creator
+        )
+        self.req = PaymentRequest.objects.create(
+            batch=self.batch,
+            status="DRAFT",
+            currency="USD",
+            created_by=self.creator,
+            beneficiary_name="Ben",
+            beneficiary_account="ACC",
+            purpose="P",
+            amount=Decimal("100"),
+        )
+        services.submit_batch(self.batch.id, self.creator.id)
+        services.approve_request(self.req.id, self.approver.id)
+        self.generated = SOAVersion.objects.filter(
+            payment_request__batch=self.batch,
+            source=SOAVersion.SOURCE_GENERATED,
+        )
+
+    def test_mark_paid_returns_200_when_soa_generation_fails(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        with patch(
+            "apps.payments.soa_export.write_batch_soa_pdf",
+            side_effect=OSError("storage unavailable"),
+        ):
+            with self.assertLogs("apps.payments.services", level="ERROR") as logs:
+                with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                    resp = client.post(
+                        f"/api/v1/requests/{self.req.id}/mark-paid",
+                        {},
+                        format="json",
+                        HTTP_IDEMPOTENCY_KEY="soa-rec-paid",
+                    )
+
+        self.assertEqual(resp.status_code, 200, getattr(resp, "data", resp.content))
+        self.assertEqual(resp.data["data"]["status"], "PAID")
+        self.assertEqual(len(callbacks), 1)
+        self.assertIn("soa_generation_failed", logs.output[0])
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.status, "COMPLETED")
+        self.assertFalse(self.generated.exists())
+
+    def _completed_batch(self, title):
+        """A batch with one request, paid without running its SOA generation."""
+        batch = PaymentBatch.objects.create(
+            title=title, status="DRAFT", created_by=self.creator
+        )
+        req = PaymentRequest.objects.create(
+            batch=batch,
+            status="DRAFT",
+            currency="USD",
+            created_by=self.creator,
+            beneficiary_name="Ben",
+            beneficiary_account="ACC",
+            purpose="P",
+            amount=Decimal("50"),
+        )
+        services.submit_batch(batch.id, self.creator.id)
+        services.approve_request(req.id, self.approver.id)
+        services.mark_paid(req.id, self.admin.id)
+        return batch
+
+    @patch(
+        "django.core.files.storage.default_storage.save",
+        return_value="soa/generated/batch_soa_x1y2z3.pdf",
+    )
+    def test_generate_twice_creates_one_set_referencing_stored_file(self, save):
+        services.mark_paid(self.req.id, self.admin.id)
+
+        created = services.generate_soa_for_batch(self.batch.id)
+        self.assertEqual(len(created), 1)
+        self.assertEqual(services.generate_soa_for_batch(self.batch.id), [])
+
+        save.assert_called_once()
+        self.assertEqual(
+            list(self.generated.values_list("document_reference", flat=True)),
+            ["soa/generated/batch_soa_x1y2z3.pdf"],
+        )
+
+    @patch("django.core.files.storage.default_storage.save")
+    def test_generate_skips_batch_not_completed(self, save):
+        self.assertEqual(services.generate_soa_for_batch(self.batch.id), [])
+        save.assert_not_called()
+        self.assertFalse(self.generated.exists())
+
+    @patch(
+        "django.core.files.storage.default_storage.save",
+        return_value="soa/generated/batch_soa.pdf",
+    )
+    def test_generate_missing_soas_continues_after_failed_batch(self, _save):
+        services.mark_paid(self.req.id, self.admin.id)
+        later = self._completed_batch("SOA Recovery Later")
+        real_write = soa_export.write_batch_soa_pdf
+
+        def write(batch_id, out, using=None):
+            if batch_id == self.batch.id:
+                raise OSError("storage unavailable")
+            return real_write(batch_id, out, using=using)
+
+        out = StringIO()
+        with patch("apps.payments.soa_export.write_batch_soa_pdf", side_effect=write):
+            with self.assertLogs(generate_missing_soas.__name__, "ERROR") as logs:
+                call_command("generate_missing_soas", stdout=out)
+
+        self.assertIn("Generated SOA for 1", out.getvalue())
+        self.assertIn("Failed to generate SOA for 1", out.getvalue())
+        self.assertIn("soa_generation_failed", logs.output[0])
+        self.assertFalse(self.generated.exists())
+        self.assertTrue(
+            SOAVersion.objects.filter(
+                payment_request__batch=later, source=SOAVersion.SOURCE_GENERATED
+            ).exists()
+        )
+
+    @patch(
+        "django.core.files.storage.default_storage.save",
+        return_value="soa/generated/batch_soa.pdf",
+    )
+    def test_generate_missing_soas_backfills_completed_batch(self, _save):
+        # Completion committed but its on_commit generation never ran
+        services.mark_paid(self.req.id, self.admin.id)
+        self.assertFalse(self.generated.exists())
+
+        out = StringIO()
+        call_command("generate_missing_soas", stdout=out)
+        self.assertIn("Generated SOA for 1", out.getvalue())
+        self.assertEqual(self.generated.count(), 1)
+
+        out = StringIO()
+        call_command("generate_missing_soas", stdout=out)
+        self.assertIn("Generated SOA for 0", out.getvalue())
+        self.assertEqual(self.generated.count(), 1)
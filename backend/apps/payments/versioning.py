@@ -34,3 +34,38 @@ def version_locked_update(queryset, current_version, **updates):
         )
 
     return updated_count
+
+
+def atomic_transition(
+    model,
+    pk,
+    from_status,
+    to_status,
+    extra_fields=None,
+    owner_field=None,
+    owner_id=None,
+):
+    """
+    Move a row from one status to another with a single conditional UPDATE.
+
+    The status (and, when given, ownership) precondition is part of the WHERE
+    clause, so no SELECT FOR UPDATE is needed beforehand.
+
+    Args:
+        model: Model class to update
+        pk: Primary key of the row
+        from_status: Status the row must currently have
+        to_status: Status to set
+        extra_fields: Optional dict of additional fields to set
+        owner_field: Optional field name the row must match owner_id on
+        owner_id: Required owner value when owner_field is given
+
+    Returns:
+        int: Number of rows updated (1 on success, 0 if any precondition failed)
+    """
+    filters = {"pk": pk, "status": from_status}
+    if owner_field is not None:
+        filters[owner_field] = owner_id
+    return model.objects.filter(**filters).update(
+        status=to_status, **(extra_fields or {})
+    )
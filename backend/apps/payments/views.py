@@ -7,6 +7,7 @@ All endpoints define permission_classes per API contract.
 
 from django.core.files.storage import default_storage
 from django.db import IntegrityError
+from django.db.models import Count
 from django.http import FileResponse, Http404, HttpResponse
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -103,16 +104,12 @@ def create_or_list_batches(request):
 
         status_filter = request.query_params.get("status")
 
-        queryset = PaymentBatch.objects.all().order_by("-created_at")
+        queryset = PaymentBatch.objects.annotate(
+            request_count=Count("requests")
+        ).order_by("-created_at")
 
         if status_filter:
-            if status_filter not in [
-                "DRAFT",
-                "SUBMITTED",
-                "PROCESSING",
-                "COMPLETED",
-                "CANCELLED",
-            ]:
+            if status_filter not in PaymentBatch.Status.values:
                 return Response(
                     {
                         "error": {
@@ -144,8 +141,8 @@ def get_batch(request, batchId):
     Get PaymentBatch detail with requests.
     """
     try:
-        batch = PaymentBatch.objects.prefetch_related(
-            "requests", "requests__soa_versions"
+        batch = PaymentBatchDetailSerializer.setup_eager_loading(
+            PaymentBatch.objects
         ).get(id=batchId)
     except PaymentBatch.DoesNotExist:
         return Response(
@@ -173,6 +170,10 @@ def submit_batch(request, batchId):
     """
     try:
         batch = services.submit_batch(batchId, request.user.id)
+        # Read back from the primary: the replica may not have the commit yet
+        batch = PaymentBatchDetailSerializer.setup_eager_loading(
+            PaymentBatch.objects.using("default")
+        ).get(id=batch.id)
         serializer = PaymentBatchDetailSerializer(batch)
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
     except DomainError:
@@ -340,11 +341,9 @@ def get_or_update_request(request, batchId, requestId):
 
     if request.method == "GET":
         try:
-            payment_request = (
-                PaymentRequest.objects.select_related("approval", "approval__approver")
-                .prefetch_related("soa_versions")
-                .get(id=requestId, batch_id=batchId)
-            )
+            payment_request = PaymentRequestDetailSerializer.setup_eager_loading(
+                PaymentRequest.objects
+            ).get(id=requestId, batch_id=batchId)
         except PaymentRequest.DoesNotExist:
             return Response(
                 {
@@ -445,13 +444,9 @@ def get_request(request, requestId):
     Get PaymentRequest by ID (standalone endpoint for approval queue).
     """
     try:
-        payment_request = (
-            PaymentRequest.objects.select_related(
-                "approval", "approval__approver", "batch"
-            )
-            .prefetch_related("soa_versions")
-            .get(id=requestId)
-        )
+        payment_request = PaymentRequestDetailSerializer.setup_eager_loading(
+            PaymentRequest.objects
+        ).get(id=requestId)
     except PaymentRequest.DoesNotExist:
         return Response(
             {
@@ -478,14 +473,7 @@ def list_pending_requests(request):
     """
     status_filter = request.query_params.get("status", "PENDING_APPROVAL")
 
-    if status_filter not in [
-        "DRAFT",
-        "SUBMITTED",
-        "PENDING_APPROVAL",
-        "APPROVED",
-        "REJECTED",
-        "PAID",
-    ]:
+    if status_filter not in PaymentRequest.Status.values:
         return Response(
             {
                 "error": {
@@ -497,10 +485,8 @@ def list_pending_requests(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    queryset = (
-        PaymentRequest.objects.select_related("batch")
-        .filter(status=status_filter)
-        .order_by("-created_at")
+    queryset = PaymentRequestListSerializer.setup_eager_loading(
+        PaymentRequest.objects.filter(status=status_filter).order_by("-created_at")
     )
 
     paginator = LimitOffsetPagination()
@@ -0,0 +1,45 @@
+"""
+Database routing for the optional read replica.
+
+Only list/count reads of the hot payments models are sent to the replica.
+Anything running inside a transaction on the primary (mutations, row locks,
+idempotency checks) keeps reading from ``default`` so it sees its own writes.
+Reads made right after a commit are not covered by that rule; code that must
+see a write it just committed pins the read with ``.using("default")``, and
+related/prefetch reads follow the database their parent row came from.
+"""
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = "replica"
+
+REPLICA_READ_MODELS = frozenset({"PaymentBatch", "PaymentRequest", "SOAVersion"})
+
+
+class ReadReplicaRouter:
+    """Send eligible payments reads to the replica; everything else to default."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != "payments":
+            return None
+        if model.__name__ not in REPLICA_READ_MODELS:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases point at the same logical database.
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
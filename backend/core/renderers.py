@@ -0,0 +1,32 @@
+"""
+JSON renderer backed by orjson.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer that encodes with orjson.
+
+    UUIDs and datetimes are serialized natively (UTC as "Z", matching DRF's
+    encoder), so serializers can hand them over unformatted. Types orjson
+    does not know (Decimal, lazy strings, querysets, ...) fall back to DRF's
+    JSONEncoder. Indented output requested by the client uses the stock
+    renderer.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(
+            data, default=_fallback_encoder.default, option=self.options
+        )
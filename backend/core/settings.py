@@ -142,6 +142,21 @@ if DATABASES["default"]["ENGINE"].endswith("postgresql"):
         "options"
     ] = f"{existing_options} {timeout_options}".strip()
 
+# ------------------------------------------------------------------
+# Optional read replica for hot payments list/count reads
+# ------------------------------------------------------------------
+
+POSTGRES_REPLICA_HOST = os.environ.get("POSTGRES_REPLICA_HOST")
+if POSTGRES_REPLICA_HOST:
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": POSTGRES_REPLICA_HOST,
+        "PORT": os.environ.get("POSTGRES_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "OPTIONS": dict(DATABASES["default"].get("OPTIONS", {})),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_ROUTERS = ["core.db_routers.ReadReplicaRouter"]
+
 # ============================================================================
 # CACHE - Redis in production, LocMem for dev/CI (throttling + future use)
 # ============================================================================
@@ -212,7 +227,7 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
-    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+    "DEFAULT_RENDERER_CLASSES": ("core.renderers.ORJSONRenderer",),
     "DEFAULT_PARSER_CLASSES": (
         "rest_framework.parsers.JSONParser",
         "rest_framework.parsers.MultiPartParser",
@@ -0,0 +1,111 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connections
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.audit.models import AuditLog
+from apps.payments import services
+from apps.payments.models import (
+    ApprovalRecord,
+    PaymentBatch,
+    PaymentRequest,
+    SOAVersion,
+)
+from apps.users.models import User
+from core.db_routers import ReadReplicaRouter
+
+
+class ReadReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = ReadReplicaRouter()
+
+    def test_hot_payments_reads_go_to_replica(self):
+        with mock.patch.object(connections["default"], "in_atomic_block", False):
+            self.assertEqual(self.router.db_for_read(PaymentBatch), "replica")
+            self.assertEqual(self.router.db_for_read(PaymentRequest), "replica")
+
+    def test_reads_inside_transaction_stay_on_default(self):
+        with mock.patch.object(connections["default"], "in_atomic_block", True):
+            self.assertEqual(self.router.db_for_read(PaymentRequest), "default")
+
+    def test_related_reads_follow_the_parent_row(self):
+        batch = PaymentBatch(title="Routed")
+        batch._state.db = "default"
+        with mock.patch.object(connections["default"], "in_atomic_block", False):
+            self.assertEqual(
+                self.router.db_for_read(PaymentRequest, instance=batch), "default"
+            )
+
+    def test_other_models_are_not_routed(self):
+        with mock.patch.object(connections["default"], "in_atomic_block", False):
+            self.assertIsNone(self.router.db_for_read(ApprovalRecord))
+            self.assertIsNone(self.router.db_for_read(AuditLog))
+
+    def test_writes_and_migrations_use_default(self):
+        self.assertEqual(self.router.db_for_write(PaymentRequest), "default")
+        self.assertTrue(self.router.allow_migrate("default", "payments"))
+        self.assertFalse(self.router.allow_migrate("replica", "payments"))
+
+
+# No "replica" alias is configured in tests, so with the router enabled any
+# read it sends to the replica fails outright.
+@override_settings(DATABASE_ROUTERS=["core.db_routers.ReadReplicaRouter"])
+class PostCommitReadTests(TransactionTestCase):
+    """Reads that follow a commit in the same request stay on the primary."""
+
+    def setUp(self):
+        self.creator = User.objects.create_user(
+            username="router_creator",
+            password="pass",
+            display_name="Router Creator",
+            role="CREATOR",
+        )
+        self.batch = PaymentBatch.objects.create(
+            title="Router Batch", status="DRAFT", created_by=self.creator
+        )
+        self.req = PaymentRequest.objects.create(
+            batch=self.batch,
+            status="DRAFT",
+            currency="USD",
+            created_by=self.creator,
+            beneficiary_name="Ben",
+            beneficiary_account="ACC",
+            purpose="P",
+            amount=Decimal("100"),
+        )
+
+    def test_submit_reloads_batch_from_primary(self):
+        client = APIClient()
+        client.force_authenticate(user=self.creator)
+        resp = client.post(
+            f"/api/v1/batches/{self.batch.id}/submit",
+            {},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="router-submit",
+        )
+        self.assertEqual(resp.status_code, 200, getattr(resp, "data", resp.content))
+        self.assertEqual(resp.data["data"]["status"], "PROCESSING")
+
+    @mock.patch(
+        "django.core.files.storage.default_storage.save",
+        return_value="soa/generated/batch_soa.pdf",
+    )
+    def test_generate_soa_after_commit_reads_from_primary(self, _save):
+        now = timezone.now()
+        PaymentBatch.objects.filter(id=self.batch.id).update(
+            status="COMPLETED", submitted_at=now, completed_at=now
+        )
+        PaymentRequest.objects.filter(id=self.req.id).update(status="PAID")
+
+        created = services.generate_soa_for_batch(self.batch.id)
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(
+            SOAVersion.objects.using("default")
+            .filter(payment_request_id=self.req.id)
+            .count(),
+            1,
+        )
@@ -0,0 +1,31 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_output_matches_drf_json_renderer(self):
+        data = {
+            "id": uuid.uuid4(),
+            "createdAt": datetime(2024, 1, 2, 3, 4, 5, 6000, tzinfo=timezone.utc),
+            "amount": "10.00",
+            "total": Decimal("10.50"),
+            "message": gettext_lazy("Not found."),
+            "detail": ErrorDetail("bad", code="invalid"),
+            "items": [1, None, True, "é"],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_indent_request_uses_stock_renderer(self):
+        rendered = ORJSONRenderer().render({"a": 1}, "application/json; indent=2", {})
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')